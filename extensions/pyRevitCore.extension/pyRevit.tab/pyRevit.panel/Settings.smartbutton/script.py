@@ -33,6 +33,12 @@ __doc__ = 'Shows the preferences window for pyRevit. You can customize how ' \
 logger = script.get_logger()
 
 
+# Revit versions with an addin-file checkbox in the settings window
+# this could be automated but it pushes me to verify and test
+# before actually adding a new Revit version to the list
+ADDIN_YEARS = ('2017', '2018', '2019', '2020', '2021')
+
+
 class EnvVariable(object):
     """List item for an environment variable.
 
@@ -41,6 +47,8 @@ class EnvVariable(object):
         Value (str): Env Variable value
     """
 
+    __slots__ = ('Id', '_value')
+
     def __init__(self, var_id, value):
         self.Id = var_id
         self._value = value
@@ -85,27 +93,48 @@ class SettingsWindow(forms.WPFWindow):
 
         self.reload_requested = False
         self.textchange_timer = None
-        self._setup_engines()
+
+        # flags tracking lazy-loaded sections; each section is set up
+        # the first time the user expands it
+        self._inited_engines = False
+        self._inited_envvars = False
+        self._inited_uiux = False
+        self._inited_routes = False
+        self._inited_telemetry = False
+        self._inited_addinfiles = False
+
+        # setup sections that are visible by default
         self._setup_user_extensions_list()
-        self._setup_env_vars_list()
 
         # check boxes for each version of Revit
-        # this could be automated but it pushes me to verify and test
-        # before actually adding a new Revit version to the list
-        self._addinfiles_cboxes = {'2017': self.revit2017_cb,
-                                   '2018': self.revit2018_cb,
-                                   '2019': self.revit2019_cb,
-                                   '2020': self.revit2020_cb,
-                                   '2021': self.revit2021_cb}
+        self._addinfiles_cboxes = \
+            tuple((year, getattr(self, 'revit{}_cb'.format(year)))
+                  for year in ADDIN_YEARS)
 
         self.set_image_source(self.lognone, 'lognone.png')
         self.set_image_source(self.logverbose, 'logverbose.png')
         self.set_image_source(self.logdebug, 'logdebug.png')
 
-        self._setup_uiux()
-        self._setup_routes()
-        self._setup_telemetry()
-        self._setup_addinfiles()
+        # map expander names to their lazy setup methods
+        # expensive sections (e.g. installed Revit scan in
+        # _setup_addinfiles) never run unless their section is opened
+        self._section_loaders = {
+            'coresettings_exp': self._setup_engines,
+            'envvars_exp': self._setup_env_vars_list,
+            'uiux_exp': self._setup_uiux,
+            'routes_exp': self._setup_routes,
+            'telemetry_exp': self._setup_telemetry,
+            'revitversions_exp': self._setup_addinfiles,
+            }
+
+    def load_section(self, sender, args):
+        """Callback method for lazy-loading a section on first expand"""
+        section_loader = self._section_loaders.get(sender.Name, None)
+        if section_loader:
+            section_loader()
+        # routes and telemetry sections test their servers on every expand
+        if sender.Name in ('routes_exp', 'telemetry_exp'):
+            self.update_telemetry_status_lights(sender, args)
 
     def _setup_core_options(self):
         """Sets up the pyRevit core configurations"""
@@ -143,6 +172,9 @@ class SettingsWindow(forms.WPFWindow):
         self.loadbetatools_cb.IsChecked = user_config.load_beta
 
     def _setup_engines(self):
+        if self._inited_engines:
+            return
+        self._inited_engines = True
         attachment = user_config.get_current_attachment()
         if attachment and attachment.Clone:
             engine_cfgs = \
@@ -152,16 +184,26 @@ class SettingsWindow(forms.WPFWindow):
                        key=lambda x: x.engine.Version, reverse=True)
 
             # add engines to ui
-            self.availableEngines.ItemsSource = \
-                [x for x in engine_cfgs if x.engine.Runtime]
-            self.cpythonEngines.ItemsSource = \
-                [x for x in engine_cfgs if not x.engine.Runtime]
+            # partition in a single pass so each engine.Runtime getter
+            # is only hit once per engine
+            runtime_engines = []
+            cpython_engines = []
+            for engine_cfg in engine_cfgs:
+                if engine_cfg.engine.Runtime:
+                    runtime_engines.append(engine_cfg)
+                else:
+                    cpython_engines.append(engine_cfg)
+            self.availableEngines.ItemsSource = runtime_engines
+            self.cpythonEngines.ItemsSource = cpython_engines
 
             # now select the current runtime engine
-            for engine_cfg in self.availableEngines.ItemsSource:
-                if engine_cfg.engine.Version == int(EXEC_PARAMS.engine_ver):
-                    self.availableEngines.SelectedItem = engine_cfg
-                    break
+            # index by version so each engine.Version getter is read once
+            runtime_cfgs = \
+                {x.engine.Version: x for x in runtime_engines}
+            active_engine_cfg = \
+                runtime_cfgs.get(int(EXEC_PARAMS.engine_ver), None)
+            if active_engine_cfg:
+                self.availableEngines.SelectedItem = active_engine_cfg
 
             # if addin-file is not writable, lock changing of the engine
             if attachment.IsReadOnly():
@@ -170,11 +212,12 @@ class SettingsWindow(forms.WPFWindow):
             # now select the current runtime engine
             self.active_cpyengine = user_config.get_active_cpython_engine()
             if self.active_cpyengine:
-                for engine_cfg in self.cpythonEngines.ItemsSource:
-                    if engine_cfg.engine.Version == \
-                            self.active_cpyengine.Version:
-                        self.cpythonEngines.SelectedItem = engine_cfg
-                        break
+                cpython_cfgs = \
+                    {x.engine.Version: x for x in cpython_engines}
+                active_cpy_cfg = \
+                    cpython_cfgs.get(self.active_cpyengine.Version, None)
+                if active_cpy_cfg:
+                    self.cpythonEngines.SelectedItem = active_cpy_cfg
             else:
                 logger.debug('Failed getting active cpython engine.')
                 self.cpythonEngines.IsEnabled = False
@@ -189,13 +232,17 @@ class SettingsWindow(forms.WPFWindow):
 
     def _setup_env_vars_list(self):
         """Reads the pyRevit environment variables and updates the list"""
-        env_vars_list = \
-            [EnvVariable(k, v)
-             for k, v in sorted(envvars.get_pyrevit_env_vars().items())]
-
-        self.envvars_lb.ItemsSource = env_vars_list
+        if self._inited_envvars:
+            return
+        self._inited_envvars = True
+        env_vars = envvars.get_pyrevit_env_vars()
+        self.envvars_lb.ItemsSource = \
+            [EnvVariable(k, env_vars[k]) for k in sorted(env_vars)]
 
     def _setup_uiux(self):
+        if self._inited_uiux:
+            return
+        self._inited_uiux = True
         applocale = applocales.get_current_applocale()
         sorted_applocales = \
             sorted(applocales.APP_LOCALES, key=lambda x: str(x.lang_type))
@@ -294,6 +341,9 @@ class SettingsWindow(forms.WPFWindow):
             self.event_telemetry_sp.Children.Add(cbox)
 
     def _setup_routes(self):
+        if self._inited_routes:
+            return
+        self._inited_routes = True
         self.routes_cb.IsChecked = user_config.routes_server
         self.coreapi_cb.IsChecked = user_config.load_core_api
         active_server = routes.get_active_server()
@@ -316,6 +366,9 @@ class SettingsWindow(forms.WPFWindow):
 
     def _setup_telemetry(self):
         """Reads the pyRevit telemetry config and updates the ui"""
+        if self._inited_telemetry:
+            return
+        self._inited_telemetry = True
         self._setup_event_telemetry_checkboxes()
 
         self.telemetry_timestamp_cb.IsChecked = \
@@ -350,36 +403,42 @@ class SettingsWindow(forms.WPFWindow):
 
     def _setup_addinfiles(self):
         """Gets the installed Revit versions and sets up the ui"""
-        installed_revits = \
-            {str(x.ProductYear):x
-             for x in TargetApps.Revit.RevitProduct.ListInstalledProducts()}
-        attachments = \
-            {str(x.Product.ProductYear):x
-             for x in PyRevit.PyRevitAttachments.GetAttachments()}
-
-        for rvt_ver, checkbox in self._addinfiles_cboxes.items():
-            if rvt_ver in attachments:
-                if rvt_ver != HOST_APP.version:
+        if self._inited_addinfiles:
+            return
+        self._inited_addinfiles = True
+        # resolve the interop products once per year up front; each
+        # .Product/.ProductYear access crosses the CLR boundary
+        installed_revits = {}
+        for product in TargetApps.Revit.RevitProduct.ListInstalledProducts():
+            installed_revits[str(product.ProductYear)] = product
+        attached_products = {}
+        for attachment in PyRevit.PyRevitAttachments.GetAttachments():
+            product = attachment.Product
+            attached_products[str(product.ProductYear)] = product
+
+        host_ver = HOST_APP.version
+        for rvt_ver, checkbox in self._addinfiles_cboxes:
+            attached_product = attached_products.get(rvt_ver, None)
+            if attached_product:
+                if rvt_ver != host_ver:
                     checkbox.Content = \
-                        self._make_product_name(
-                            attachments[rvt_ver].Product,
-                            ''
-                            )
+                        self._make_product_name(attached_product, '')
                     checkbox.IsEnabled = True
                     checkbox.IsChecked = True
                 else:
                     checkbox.Content = \
                         self._make_product_name(
-                            attachments[rvt_ver].Product,
+                            attached_product,
                             '<Current version>'
                             )
                     checkbox.IsEnabled = False
                     checkbox.IsChecked = True
             else:
-                if rvt_ver in installed_revits:
+                installed_product = installed_revits.get(rvt_ver, None)
+                if installed_product:
                     checkbox.Content = \
                         self._make_product_name(
-                            installed_revits[rvt_ver],
+                            installed_product,
                             '<Not attached>'
                             )
                     checkbox.IsEnabled = True
@@ -407,29 +466,39 @@ class SettingsWindow(forms.WPFWindow):
                 if not self.is_same_version_as_running(new_engine):
                     forms.alert('Active engine has changed. '
                                 'Restart Revit for this change to take effect.')
-                # configure the engine on this version
-                PyRevit.PyRevitAttachments.Attach(
-                    int(HOST_APP.version),
-                    attachment.Clone,
-                    new_engine,
-                    all_users
-                    )
 
-                # now setup the attachments for other versions
-                for rvt_ver, checkbox in self._addinfiles_cboxes.items():
-                    if checkbox.IsEnabled:
-                        if checkbox.IsChecked:
-                            PyRevit.PyRevitAttachments.Attach(
-                                int(rvt_ver),
-                                attachment.Clone,
-                                new_engine,
-                                all_users
-                                )
-                        else:
-                            PyRevit.PyRevitAttachments.Detach(int(rvt_ver))
+                # collect all attachment updates first and apply them in
+                # one go; the running version is always re-attached to
+                # configure the selected engine on it
+                attach_vers = [int(HOST_APP.version)]
+                detach_vers = []
+                # skip the other versions if the revit versions section was
+                # never loaded since the checkboxes would not reflect the
+                # attachment states
+                if self._inited_addinfiles:
+                    for rvt_ver, checkbox in self._addinfiles_cboxes:
+                        if checkbox.IsEnabled:
+                            if checkbox.IsChecked:
+                                attach_vers.append(int(rvt_ver))
+                            else:
+                                detach_vers.append(int(rvt_ver))
+
+                for rvt_ver in attach_vers:
+                    PyRevit.PyRevitAttachments.Attach(
+                        rvt_ver,
+                        attachment.Clone,
+                        new_engine,
+                        all_users
+                        )
+                for rvt_ver in detach_vers:
+                    PyRevit.PyRevitAttachments.Detach(rvt_ver)
         else:
             logger.error('Error determining current attached clone.')
 
+    def validate_digits_only(self, sender, args):
+        """Callback method for rejecting non-digit input in numeric fields"""
+        args.Handled = not args.Text.isdigit()
+
     def resetreportinglevel(self, sender, args):
         """Callback method for resetting logging levels to defaults"""
         self.verbose_rb.IsChecked = True
@@ -459,20 +528,24 @@ class SettingsWindow(forms.WPFWindow):
         if new_path:
             new_path = os.path.normpath(new_path)
 
-        if self.extfolders_lb.ItemsSource:
-            uniq_items = set(self.extfolders_lb.ItemsSource)
-            uniq_items.add(new_path)
-            self.extfolders_lb.ItemsSource = list(uniq_items)
-        else:
-            self.extfolders_lb.ItemsSource = [new_path]
+        # keep user-visible folder order; dedup with a simple membership
+        # check instead of the set round-trip that shuffled the list
+        ext_folders = list(self.extfolders_lb.ItemsSource or [])
+        if new_path not in ext_folders:
+            ext_folders.append(new_path)
+        self.extfolders_lb.ItemsSource = ext_folders
 
     def removefolder(self, sender, args):
         """Callback method for removing extension folder from configs"""
         selected_path = self.extfolders_lb.SelectedItem
         if selected_path and self.extfolders_lb.ItemsSource:
-            uniq_items = set(self.extfolders_lb.ItemsSource)
-            uniq_items.remove(selected_path)
-            self.extfolders_lb.ItemsSource = list(uniq_items)
+            ext_folders = list(self.extfolders_lb.ItemsSource)
+            try:
+                ext_folders.remove(selected_path)
+            except ValueError:
+                # selected item is already gone from the folder list
+                pass
+            self.extfolders_lb.ItemsSource = ext_folders
 
     def removeallfolders(self, sender, args):
         """Callback method for removing all extension folders"""
@@ -622,18 +695,22 @@ class SettingsWindow(forms.WPFWindow):
             user_config.log_level = PyRevit.PyRevitLogLevels.Debug
 
         user_config.file_logging = self.filelogging_cb.IsChecked
-        user_config.startuplog_timeout = int(self.startup_log_timeout.Text)
+        # these textboxes only accept digits (see validate_digits_only)
+        # so the values are parsed directly without exception handling
+        startuplog_timeout = self.startup_log_timeout.Text
+        user_config.startuplog_timeout = \
+            int(startuplog_timeout) if startuplog_timeout.isdigit() else 0
         user_config.required_host_build = self.requiredhostbuild_tb.Text
-        try:
-            min_freespace = int(self.minhostdrivefreespace_tb.Text)
-            user_config.min_host_drivefreespace = min_freespace
-        except ValueError:
-            logger.error('Minimum free space value must be an integer.')
-            user_config.min_host_drivefreespace = 0
+        min_freespace = self.minhostdrivefreespace_tb.Text
+        user_config.min_host_drivefreespace = \
+            int(min_freespace) if min_freespace.isdigit() else 0
 
         user_config.load_beta = self.loadbetatools_cb.IsChecked
 
     def _save_engines(self):
+        # if engines section was never loaded, nothing could have changed
+        if not self._inited_engines:
+            return
         # set active cpython engine
         engine_cfg = self.cpythonEngines.SelectedItem
         if engine_cfg:
@@ -653,6 +730,9 @@ class SettingsWindow(forms.WPFWindow):
             user_config.set_thirdparty_ext_root_dirs([])
 
     def _save_uiux(self):
+        # if ui/ux section was never loaded, nothing could have changed
+        if not self._inited_uiux:
+            return False
         request_reload = False
         current_applocale = applocales.get_current_applocale()
         if self.applocales_cb.SelectedItem:
@@ -684,6 +764,9 @@ class SettingsWindow(forms.WPFWindow):
         return request_reload
 
     def _save_routes(self):
+        # if routes section was never loaded, nothing could have changed
+        if not self._inited_routes:
+            return False
         request_reload = False
 
         # decide to turn off or on
@@ -710,6 +793,9 @@ class SettingsWindow(forms.WPFWindow):
         return request_reload
 
     def _save_telemetry(self):
+        # if telemetry section was never loaded, nothing could have changed
+        if not self._inited_telemetry:
+            return
         # set telemetry configs
         # pyrevit telemetry
         telemetry.set_telemetry_utc_timestamp(
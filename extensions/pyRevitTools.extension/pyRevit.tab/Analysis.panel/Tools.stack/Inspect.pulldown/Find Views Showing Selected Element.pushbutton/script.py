@@ -15,10 +15,10 @@ allviews = cl_views.OfCategory(DB.BuiltInCategory.OST_Views)\
                    .WhereElementIsNotElementType()\
                    .ToElements()
 
-views = filter(lambda x: ((x.ViewType != DB.ViewType.DraftingView
-                           or x.ViewType != DB.ViewType.ThreeD)
-                          and not x.IsTemplate),
-               allviews)
+views = [x for x in allviews
+         if (x.ViewType != DB.ViewType.DraftingView
+             or x.ViewType != DB.ViewType.ThreeD)
+         and not x.IsTemplate]
 
 # process visible elements in views
 view_list = []
@@ -5,7 +5,10 @@ Reapply the previous matched properties.
 
 """
 #pylint: disable=import-error,invalid-name,broad-except
-import pickle
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from pyrevit import revit, DB
 from pyrevit import forms
@@ -31,7 +34,7 @@ class PropKeyValue(object):
 
 MEMFILE = script.get_document_data_file(
     file_id='MatchSelectedProperties',
-    file_ext='pym',
+    file_ext='pym2',
     add_cmd_name=False
     )
 
@@ -128,8 +131,8 @@ def recall():
     """Load last matched properties from memory."""
     data = []
     try:
-        with open(MEMFILE, 'r') as mf:
-            data = pickle.load(mf)
+        with open(MEMFILE, 'rb') as mf:
+            data = pickle.loads(mf.read())
     except Exception as ex:
         logger.debug(
             "Failed loading matched properties from memory | %s", str(ex)
@@ -139,8 +142,8 @@ def recall():
 
 def remember(src_props):
     """Save selected matched properties to memory."""
-    with open(MEMFILE, 'w') as mf:
-        pickle.dump(src_props, mf)
+    with open(MEMFILE, 'wb') as mf:
+        pickle.dump(src_props, mf, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 # main
@@ -1,4 +1,7 @@
-import pickle
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from pyrevit import script
 from pyrevit import revit
@@ -12,20 +15,18 @@ __doc__ = 'Append current selection to memory.\n'\
           'selection memory saved in %appdata%/pyRevit folder as *.pym files.'
 
 
-datafile = script.get_document_data_file("SelList", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
 
 
 selection = revit.get_selection()
-selected_ids = {str(elid.IntegerValue) for elid in selection.element_ids}
+selected_ids = {elid.IntegerValue for elid in selection.element_ids}
 
 try:
-    f = open(datafile, 'r')
-    prevsel = pickle.load(f)
+    with open(datafile, 'rb') as f:
+        prevsel = pickle.loads(f.read())
     new_selection = prevsel.union(selected_ids)
-    f.close()
 except Exception:
     new_selection = selected_ids
 
-f = open(datafile, 'w')
-pickle.dump(new_selection, f)
-f.close()
+with open(datafile, 'wb') as f:
+    pickle.dump(new_selection, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,4 +1,7 @@
-import pickle
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from pyrevit.framework import List
 from pyrevit import script
@@ -13,17 +16,16 @@ __doc__ = 'Read selection from memory.\n'\
 
 selection = revit.get_selection()
 
-datafile = script.get_document_data_file("SelList", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
 
 
 try:
-    f = open(datafile, 'r')
-    current_selection = pickle.load(f)
-    f.close()
+    with open(datafile, 'rb') as f:
+        current_selection = pickle.loads(f.read())
 
     element_ids = []
     for elid in current_selection:
-        element_ids.append(DB.ElementId(int(elid)))
+        element_ids.append(DB.ElementId(elid))
 
     selection.set_to(element_ids)
 except Exception:
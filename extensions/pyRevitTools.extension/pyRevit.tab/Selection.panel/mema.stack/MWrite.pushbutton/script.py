@@ -1,4 +1,7 @@
-import pickle
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from pyrevit import script
 from pyrevit import revit
@@ -12,11 +15,10 @@ __doc__ = 'Clear memory and Append current selection.\n'\
           'selection memory saved in %appdata%/pyRevit folder as *.pym files.'
 
 
-datafile = script.get_document_data_file("SelList", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
 
 selection = revit.get_selection()
-selected_ids = {str(elid.IntegerValue) for elid in selection.element_ids}
+selected_ids = {elid.IntegerValue for elid in selection.element_ids}
 
-f = open(datafile, 'w')
-pickle.dump(selected_ids, f)
-f.close()
+with open(datafile, 'wb') as f:
+    pickle.dump(selected_ids, f, protocol=pickle.HIGHEST_PROTOCOL)
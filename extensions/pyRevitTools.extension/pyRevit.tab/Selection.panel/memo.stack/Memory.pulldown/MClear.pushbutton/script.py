@@ -1,6 +1,9 @@
 import os
 import os.path as op
-import pickle as pl
+try:
+    import cPickle as pl
+except ImportError:
+    import pickle as pl
 
 from pyrevit import revit
 from pyrevit import script
@@ -12,8 +15,7 @@ __doc__ = 'Clears selection from memory.\n'\
           'selection memory saved in %appdata%/pyRevit folder as *.pym files.'
 
 
-datafile = script.get_document_data_file("SelList", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
 
-f = open(datafile, 'wb')
-pl.dump([], f)
-f.close()
+with open(datafile, 'wb') as f:
+    pl.dump([], f, protocol=pl.HIGHEST_PROTOCOL)
@@ -1,6 +1,9 @@
 import os
 import os.path as op
-import pickle as pl
+try:
+    import cPickle as pl
+except ImportError:
+    import pickle as pl
 
 from pyrevit import revit
 from pyrevit import script
@@ -12,20 +15,17 @@ __doc__ = 'Deducts selection from memory keeping the rest.\n'\
           'selection memory saved in %appdata%/pyRevit folder as *.pym files.'
 
 
-datafile = script.get_document_data_file("SelList", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
 
 selection = revit.get_selection()
-selected_ids = {str(elid.IntegerValue) for elid in selection.element_ids}
+selected_ids = {elid.IntegerValue for elid in selection.element_ids}
 
 try:
-    f = open(datafile, 'r')
-    prevsel = pl.load(f)
+    with open(datafile, 'rb') as f:
+        prevsel = pl.loads(f.read())
     newsel = prevsel.difference(selected_ids)
-    f.close()
-    f = open(datafile, 'w')
-    pl.dump(newsel, f)
-    f.close()
+    with open(datafile, 'wb') as f:
+        pl.dump(newsel, f, protocol=pl.HIGHEST_PROTOCOL)
 except Exception:
-    f = open(datafile, 'w')
-    pl.dump([], f)
-    f.close()
+    with open(datafile, 'wb') as f:
+        pl.dump([], f, protocol=pl.HIGHEST_PROTOCOL)
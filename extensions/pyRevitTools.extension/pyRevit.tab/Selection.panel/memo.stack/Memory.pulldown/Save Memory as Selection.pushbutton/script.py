@@ -1,7 +1,10 @@
 """Saves current selection memory as a Selection Filter."""
 #pylint: disable=import-error,invalid-name,broad-except
 import os.path as op
-import pickle as pl
+try:
+    import cPickle as pl
+except ImportError:
+    import pickle as pl
 
 from pyrevit import coreutils
 from pyrevit import revit, DB
@@ -10,7 +13,7 @@ from pyrevit import script
 logger = script.get_logger()
 
 proj_info = revit.query.get_project_info()
-data_file = script.get_document_data_file("SelList", "pym")
+data_file = script.get_document_data_file("SelList", "pym2")
 logger.debug(data_file)
 
 if op.exists(data_file):
@@ -21,8 +24,8 @@ if op.exists(data_file):
         filter_name = \
             'SavedSelection_' + coreutils.timestamp()
 
-    with open(data_file, 'r') as f:
-        cursel = pl.load(f)
+    with open(data_file, 'rb') as f:
+        cursel = pl.loads(f.read())
 
     with revit.Transaction('pySaveSelection'):
         selection_filter = \
@@ -31,4 +34,4 @@ if op.exists(data_file):
                 coreutils.cleanup_filename(filter_name)
                 )
         for elid in cursel:
-            selection_filter.AddSingle(DB.ElementId(int(elid)))
+            selection_filter.AddSingle(DB.ElementId(elid))
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 import os
 import os.path as op
+import struct
 import sys
-import pickle
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from pyrevit.framework import List
 from pyrevit import revit, DB
@@ -11,38 +15,47 @@ from pyrevit import script
 
 logger = script.get_logger()
 
-datafile = script.get_document_data_file("SelList", "pym")
-index_datafile = script.get_document_data_file("SelListPrevNextIndex", "pym")
+datafile = script.get_document_data_file("SelList", "pym2")
+index_datafile = script.get_document_data_file("SelListPrevNextIndex", "pym2")
+
+# index file is a single integer; a fixed struct record with a
+# magic+version header is much cheaper to read back than a pickle
+INDEX_RECORD = struct.Struct('<4sq')
+INDEX_MAGIC = b'PYX1'
 
 
 selection = revit.get_selection()
 
 
 def iterate(mode, step_size=1):
+    idx = 0
     if op.exists(index_datafile):
-        with open(index_datafile, 'r') as f:
-            idx = pickle.load(f)
-
-        if mode == '-':
-            idx = idx - step_size
-        else:
-            idx = idx + step_size
-    else:
-        idx = 0
+        try:
+            with open(index_datafile, 'rb') as f:
+                magic, idx = INDEX_RECORD.unpack(f.read(INDEX_RECORD.size))
+            if magic != INDEX_MAGIC:
+                # old pickle-formatted index file; start over
+                idx = 0
+            elif mode == '-':
+                idx = idx - step_size
+            else:
+                idx = idx + step_size
+        except struct.error:
+            idx = 0
 
     try:
-        with open(datafile, 'r') as df:
-            cursel = pickle.load(df)
+        with open(datafile, 'rb') as df:
+            cursel = pickle.loads(df.read())
 
         if idx < 0:
             idx = abs(idx / len(cursel)) * len(cursel) + idx
         elif idx >= len(cursel):
             idx = idx - abs(idx / len(cursel)) * len(cursel)
 
-        selection.set_to([DB.ElementId(int(list(cursel)[idx]))])
+        selection.set_to([DB.ElementId(list(cursel)[idx])])
 
-        with open(index_datafile, 'w') as f:
-            pickle.dump(idx, f)
+        with open(index_datafile, 'wb') as f:
+            f.write(INDEX_RECORD.pack(INDEX_MAGIC, idx))
 
     except Exception as io_err:
         logger.error('Error read/write to: {} | {}'.format(datafile, io_err))
@@ -10,5 +10,6 @@ from pyrevit import revit
 __context__ = 'selection'
 
 
-mirrored_elements = revit.select.select_mirrored(revit.get_selection())
-revit.get_selection().set_to(mirrored_elements)
+selection = revit.get_selection()
+if not selection.is_empty:
+    selection.set_to(revit.select.select_mirrored(selection))
@@ -6,6 +6,76 @@ from pyrevit import revit, DB
 __doc__ = 'Isolates specific elements in current view and '\
           'put the view in isolate element mode.'
 
+
+def collect_room_tags(curview):
+    roomtags = DB.FilteredElementCollector(revit.doc, curview.Id)\
+                 .OfCategory(DB.BuiltInCategory.OST_RoomTags)\
+                 .WhereElementIsNotElementType()\
+                 .ToElementIds()
+
+    rooms = DB.FilteredElementCollector(revit.doc, curview.Id)\
+              .OfCategory(DB.BuiltInCategory.OST_Rooms)\
+              .WhereElementIsNotElementType()\
+              .ToElementIds()
+
+    allelements = []
+    allelements.extend(rooms)
+    allelements.extend(roomtags)
+    return List[DB.ElementId](allelements)
+
+
+def collect_model_groups(curview):
+    elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
+                 .WhereElementIsNotElementType()\
+                 .ToElementIds()
+
+    modelgroups = []
+    expanded = []
+    for elid in elements:
+        el = revit.doc.GetElement(elid)
+        if isinstance(el, DB.Group) and not el.ViewSpecific:
+            modelgroups.append(elid)
+            members = el.GetMemberIds()
+            expanded.extend(list(members))
+
+    expanded.extend(modelgroups)
+    return List[DB.ElementId](expanded)
+
+
+def collect_painted_elements(curview):
+    painted = []
+
+    elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
+                 .WhereElementIsNotElementType()\
+                 .ToElementIds()
+
+    for elId in elements:
+        el = revit.doc.GetElement(elId)
+        if len(list(el.GetMaterialIds(True))) > 0:
+            painted.append(elId)
+        elif isinstance(el, DB.Wall) and el.IsStackedWall:
+            memberWalls = el.GetStackedWallMemberIds()
+            for mwid in memberWalls:
+                mw = revit.doc.GetElement(mwid)
+                if len(list(mw.GetMaterialIds(True))) > 0:
+                    painted.append(elId)
+    return List[DB.ElementId](painted)
+
+
+def collect_model_elements(curview):
+    elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
+                 .WhereElementIsNotElementType()\
+                 .ToElementIds()
+
+    element_to_isolate = []
+    for elid in elements:
+        el = revit.doc.GetElement(elid)
+        if not el.ViewSpecific:  # and not isinstance(el, DB.Dimension):
+            element_to_isolate.append(elid)
+
+    return List[DB.ElementId](element_to_isolate)
+
+
 element_cats = {'Area Lines': DB.BuiltInCategory.OST_AreaSchemeLines,
                 'Doors': DB.BuiltInCategory.OST_Doors,
                 'Room Separation Lines':
@@ -15,6 +85,13 @@ element_cats = {'Area Lines': DB.BuiltInCategory.OST_AreaSchemeLines,
                 'Painted Elements': None,
                 'Model Elements': None}
 
+# option-name to collector function; options without a dedicated
+# collector fall back to the generic category collector below
+collectors = {'Room Tags': collect_room_tags,
+              'Model Groups': collect_model_groups,
+              'Painted Elements': collect_painted_elements,
+              'Model Elements': collect_model_elements}
+
 
 selected_switch = \
     forms.CommandSwitchWindow.show(
@@ -26,71 +103,9 @@ selected_switch = \
 if selected_switch:
     curview = revit.active_view
 
-    if selected_switch == 'Room Tags':
-        roomtags = DB.FilteredElementCollector(revit.doc, curview.Id)\
-                     .OfCategory(DB.BuiltInCategory.OST_RoomTags)\
-                     .WhereElementIsNotElementType()\
-                     .ToElementIds()
-
-        rooms = DB.FilteredElementCollector(revit.doc, curview.Id)\
-                  .OfCategory(DB.BuiltInCategory.OST_Rooms)\
-                  .WhereElementIsNotElementType()\
-                  .ToElementIds()
-
-        allelements = []
-        allelements.extend(rooms)
-        allelements.extend(roomtags)
-        element_to_isolate = List[DB.ElementId](allelements)
-
-    elif selected_switch == 'Model Groups':
-        elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
-                     .WhereElementIsNotElementType()\
-                     .ToElementIds()
-
-        modelgroups = []
-        expanded = []
-        for elid in elements:
-            el = revit.doc.GetElement(elid)
-            if isinstance(el, DB.Group) and not el.ViewSpecific:
-                modelgroups.append(elid)
-                members = el.GetMemberIds()
-                expanded.extend(list(members))
-
-        expanded.extend(modelgroups)
-        element_to_isolate = List[DB.ElementId](expanded)
-
-    elif selected_switch == 'Painted Elements':
-        set = []
-
-        elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
-                     .WhereElementIsNotElementType()\
-                     .ToElementIds()
-
-        for elId in elements:
-            el = revit.doc.GetElement(elId)
-            if len(list(el.GetMaterialIds(True))) > 0:
-                set.append(elId)
-            elif isinstance(el, DB.Wall) and el.IsStackedWall:
-                memberWalls = el.GetStackedWallMemberIds()
-                for mwid in memberWalls:
-                    mw = revit.doc.GetElement(mwid)
-                    if len(list(mw.GetMaterialIds(True))) > 0:
-                        set.append(elId)
-        element_to_isolate = List[DB.ElementId](set)
-
-    elif selected_switch == 'Model Elements':
-        elements = DB.FilteredElementCollector(revit.doc, curview.Id)\
-                     .WhereElementIsNotElementType()\
-                     .ToElementIds()
-
-        element_to_isolate = []
-        for elid in elements:
-            el = revit.doc.GetElement(elid)
-            if not el.ViewSpecific:  # and not isinstance(el, DB.Dimension):
-                element_to_isolate.append(elid)
-
-        element_to_isolate = List[DB.ElementId](element_to_isolate)
-
+    collector = collectors.get(selected_switch, None)
+    if collector:
+        element_to_isolate = collector(curview)
     else:
         element_to_isolate = \
             DB.FilteredElementCollector(revit.doc, curview.Id)\
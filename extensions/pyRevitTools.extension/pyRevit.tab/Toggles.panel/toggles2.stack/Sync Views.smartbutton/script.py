@@ -7,7 +7,15 @@ This tool works best when the views are maximized.
 #pylint: disable=import-error,invalid-name,broad-except,superfluous-parens
 import os
 import os.path as op
-import pickle as pl
+import io
+try:
+    import cPickle as pl
+except ImportError:
+    import pickle as pl
+try:
+    import mmap
+except ImportError:
+    mmap = None
 import math
 
 from pyrevit import framework
@@ -32,7 +40,7 @@ SUPPORTED_VIEW_TYPES = (
 def get_data_filename(document):
     """Get temporary datafile name for given document"""
     project_name = op.splitext(op.basename(document.PathName))[0]
-    return project_name + '_pySyncRevitActiveViewZoomState'
+    return project_name + '_pySyncRevitActiveViewZoomState2'
 
 
 def get_datafile(document):
@@ -41,6 +49,21 @@ def get_datafile(document):
     return script.get_instance_data_file(data_filename)
 
 
+def read_datafile(datafile):
+    """Prefetch datafile content so successive pickle loads read from
+    memory instead of re-entering buffered file io per load; maps the
+    file directly when mmap is available (not on ironpython)
+    """
+    with open(datafile, 'rb') as df:
+        if mmap:
+            mapped = mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return io.BytesIO(mapped.read(mapped.size()))
+            finally:
+                mapped.close()
+        return io.BytesIO(df.read())
+
+
 def is_close(a, b, rnd=5):
     """Determine if a is close enough to b"""
     return a == b or int(a*10**rnd) == int(b*10**rnd)
@@ -67,20 +90,23 @@ def copy_zoomstate(sender, args):
             # get zoom corners
             cornerlist = current_ui_view.GetZoomCorners()
             # and save the info
-            f = open(get_datafile(event_doc), 'w')
+            f = open(get_datafile(event_doc), 'wb')
             try:
-                # dump current view type
-                pl.dump(type(args.CurrentActiveView).__name__, f)
-                # dump zoom and center
-                pl.dump([revit.serialize(x) for x in cornerlist], f)
-                # dump ViewOrientation3D
+                # grab ViewOrientation3D or view direction
+                extra_state = None
                 if isinstance(args.CurrentActiveView, DB.View3D):
                     orientation = args.CurrentActiveView.GetOrientation()
-                    pl.dump(revit.serialize(orientation),
-                            f)
+                    extra_state = revit.serialize(orientation)
                 elif isinstance(args.CurrentActiveView, DB.ViewSection):
                     direction = args.CurrentActiveView.ViewDirection
-                    pl.dump(revit.serialize(direction), f)
+                    extra_state = revit.serialize(direction)
+                # dump view type, zoom corners, and extra state as one
+                # tuple so the load side makes a single unpickle call
+                pl.dump((type(args.CurrentActiveView).__name__,
+                         [revit.serialize(x) for x in cornerlist],
+                         extra_state),
+                        f,
+                        protocol=pl.HIGHEST_PROTOCOL)
             except Exception as copy_ex:
                 logger.dev_log("copy_zoomstate::store", str(copy_ex))
             finally:
@@ -108,22 +134,20 @@ def apply_zoomstate(sender, args):
                 return
 
             # load zoom data
-            f = open(get_datafile(event_doc), 'r')
+            f = read_datafile(get_datafile(event_doc))
             try:
-                view_type_saved = pl.load(f)
+                view_type_saved, corners, extra_state = pl.load(f)
                 if view_type_saved != type(args.CurrentActiveView).__name__:
                     raise Exception()
-                vc1, vc2 = pl.load(f)
-                # load ViewOrientation3D
+                vc1, vc2 = corners
+                # apply ViewOrientation3D
                 if isinstance(args.CurrentActiveView, DB.View3D):
                     if args.CurrentActiveView.IsLocked:
                         raise Exception()
-                    view_orientation = pl.load(f)
                     args.CurrentActiveView.SetOrientation(
-                        view_orientation.deserialize())
+                        extra_state.deserialize())
                 elif isinstance(args.CurrentActiveView, DB.ViewSection):
-                    direction = pl.load(f)
-                    angle = direction.deserialize().AngleTo(
+                    angle = extra_state.deserialize().AngleTo(
                         args.CurrentActiveView.ViewDirection
                         )
                     if not is_close(angle, math.pi) and not is_close(angle, 0):
@@ -90,9 +90,11 @@ else:
     ENGINES_DIR = ADDIN_RESOURCE_DIR = None
 
 # add the framework dll path to the search paths
-sys.path.append(BIN_DIR)
-sys.path.append(ADDIN_DIR)
-sys.path.append(ENGINES_DIR)
+# guard against duplicate appends; this module is re-imported by every
+# engine and sys.path must not grow over the life of the host session
+for _search_dir in (BIN_DIR, ADDIN_DIR, ENGINES_DIR):
+    if _search_dir and _search_dir not in sys.path:
+        sys.path.append(_search_dir)
 
 
 PYREVIT_CLI_PATH = op.join(BIN_DIR, PYREVIT_CLI_NAME)
@@ -119,6 +121,15 @@ class PyRevitException(Exception):
     Parameters args and message are derived from Exception class.
     """
 
+    def __init__(self, *args):
+        super(PyRevitException, self).__init__(*args)
+        # grab the traceback report once at creation; formatting the
+        # exception later must be cheap and must not touch (or mutate)
+        # the interpreter exception state
+        exc_tb = sys.exc_info()[2]
+        self._tb_report = \
+            traceback.format_tb(exc_tb)[0] if exc_tb else ''
+
     @property
     def msg(self):
         """Return exception message."""
@@ -132,17 +143,15 @@ class PyRevitException(Exception):
 
     def __str__(self):
         """Process stack trace and prepare report for output window."""
-        sys.exc_type, sys.exc_value, sys.exc_traceback = sys.exc_info()
-        try:
-            tb_report = traceback.format_tb(sys.exc_traceback)[0]
-            if self.msg:
-                return '{}\n\n{}\n{}'.format(self.msg,
-                                             TRACEBACK_TITLE,
-                                             tb_report)
-            else:
-                return '{}\n{}'.format(TRACEBACK_TITLE, tb_report)
-        except Exception:
+        tb_report = getattr(self, '_tb_report', '')
+        if not tb_report:
             return Exception.__str__(self)
+        elif self.msg:
+            return '{}\n\n{}\n{}'.format(self.msg,
+                                         TRACEBACK_TITLE,
+                                         tb_report)
+        else:
+            return '{}\n{}'.format(TRACEBACK_TITLE, tb_report)
 
 
 class PyRevitIOError(PyRevitException):
@@ -183,6 +192,28 @@ Attributes:
 """
 
 
+class _cached_property(object):
+    """Private compute-once property descriptor.
+
+    The getter runs on first access and its value is stored on the
+    instance under the same name; later accesses read the stored value
+    directly. Used for host info that is constant for the lifetime of
+    the Revit process (version, username, process info) so repeat
+    accesses do not cross into the host API every time.
+    """
+
+    def __init__(self, fget):
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.fget(instance)
+        instance.__dict__[self.fget.__name__] = value
+        return value
+
+
 class _HostApplication(object):
     """Private Wrapper for Current Instance of Revit.
 
@@ -255,7 +286,7 @@ class _HostApplication(object):
         """Return :obj:`list` of available Revit server names."""
         return list(self.app.GetRevitServerNetworkHosts())
 
-    @property
+    @_cached_property
     def version(self):
         """str: Return version number (e.g. '2018')."""
         return self.app.VersionNumber
@@ -265,12 +296,12 @@ class _HostApplication(object):
         """str: Return subversion number (e.g. '2018.3')."""
         return self.app.SubVersionNumber
 
-    @property
+    @_cached_property
     def version_name(self):
         """str: Return version name (e.g. 'Autodesk Revit 2018')."""
         return self.app.VersionName
 
-    @property
+    @_cached_property
     def build(self):
         """str: Return build number (e.g. '20170927_1515(x64)')."""
         if int(self.version) >= 2021:
@@ -304,7 +335,7 @@ class _HostApplication(object):
         """str: Return language type (e.g. 'LanguageType.English_USA')."""
         return self.app.Language
 
-    @property
+    @_cached_property
     def username(self):
         """str: Return the username from Revit API (Application.Username)."""
         uname = self.app.Username
@@ -313,25 +344,25 @@ class _HostApplication(object):
         uname = uname.replace('.', '')
         return uname
 
-    @property
+    @_cached_property
     def proc(self):
         """System.Diagnostics.Process: Return current process object."""
         return Process.GetCurrentProcess()
 
-    @property
+    @_cached_property
     def proc_id(self):
         """int: Return current process id."""
-        return Process.GetCurrentProcess().Id
+        return self.proc.Id
 
-    @property
+    @_cached_property
     def proc_name(self):
         """str: Return current process name."""
-        return Process.GetCurrentProcess().ProcessName
+        return self.proc.ProcessName
 
-    @property
+    @_cached_property
     def proc_path(self):
         """str: Return file path for the current process main module."""
-        return Process.GetCurrentProcess().MainModule.FileName
+        return self.proc.MainModule.FileName
 
     @property
     def proc_window(self):
@@ -349,18 +380,18 @@ class _HostApplication(object):
     @property
     def proc_screen_workarea(self):
         """``System.Drawing.Rectangle``: Return screen working area."""
-        screen = HOST_APP.proc_screen
+        screen = self.proc_screen
         if screen:
             return screen.WorkingArea
 
     @property
     def proc_screen_scalefactor(self):
         """float: Return scaling for screen hosting current process."""
-        screen = HOST_APP.proc_screen
+        screen = self.proc_screen
         if screen:
-            actual_wdith = Windows.SystemParameters.PrimaryScreenWidth
-            scaled_width = screen.PrimaryScreen.WorkingArea.Width
-            return abs(scaled_width / actual_wdith)
+            actual_width = float(Windows.SystemParameters.PrimaryScreenWidth)
+            scaled_width = float(screen.PrimaryScreen.WorkingArea.Width)
+            return abs(scaled_width / actual_width)
 
     def is_newer_than(self, version, or_equal=False):
         """bool: Return True if host app is newer than provided version.
@@ -438,6 +469,17 @@ except Exception:
 # -----------------------------------------------------------------------------
 # Wrapper to access builtin parameters set in scope by C# Script Executor
 # -----------------------------------------------------------------------------
+def _get_command_builtin(builtin_name):
+    """Read a value the script executor has set on __builtins__.
+
+    __builtins__ is a dict or a module depending on how this module
+    was imported; resolve either way with a single lookup.
+    """
+    if isinstance(__builtins__, dict):
+        return __builtins__.get(builtin_name)
+    return getattr(__builtins__, builtin_name, None)
+
+
 class _ExecutorParams(object):
     """Private Wrapper that provides runtime environment info."""
 
@@ -497,26 +539,30 @@ class _ExecutorParams(object):
     @property   # read-only
     def output_stream(self):
         """Return ScriptIO"""
-        if self.script_runtime:
-            return self.script_runtime.OutputStream
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.OutputStream
 
     @property   # read-only
     def script_data(self):
         """Return ScriptRuntime.ScriptData"""
-        if self.script_runtime:
-            return self.script_runtime.ScriptData
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.ScriptData
 
     @property   # read-only
     def script_runtime_cfgs(self):
         """Return ScriptRuntime.ScriptRuntimeConfigs"""
-        if self.script_runtime:
-            return self.script_runtime.ScriptRuntimeConfigs
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.ScriptRuntimeConfigs
 
     @property   # read-only
     def engine_cfgs(self):
         """Return ScriptRuntime.ScriptRuntimeConfigs"""
-        if self.script_runtime:
-            return self.script_runtime.EngineConfigs
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.EngineConfigs
 
     @property
     def command_mode(self):
@@ -526,68 +572,77 @@ class _ExecutorParams(object):
     @property
     def event_sender(self):
         """``Object``: Return event sender object."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.EventSender
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.EventSender
 
     @property
     def event_args(self):
         """``DB.RevitAPIEventArgs``: Return event arguments object."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.EventArgs
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.EventArgs
 
     @property   # read-only
     def needs_refreshed_engine(self):
         """bool: Check if command needs a newly refreshed IronPython engine."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.RefreshEngine
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.RefreshEngine
         else:
             return False
 
     @property   # read-only
     def debug_mode(self):
         """bool: Check if command is in debug mode."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.DebugMode
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.DebugMode
         else:
             return False
 
     @property   # read-only
     def config_mode(self):
         """bool: Check if command is in config mode."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.ConfigMode
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.ConfigMode
         else:
             return False
 
     @property   # read-only
     def executed_from_ui(self):
         """bool: Check if command was executed from ui."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.ExecutedFromUI
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.ExecutedFromUI
         else:
             return False
 
     @property   # read-only
     def needs_clean_engine(self):
         """bool: Check if command needs a clean IronPython engine."""
-        if self.engine_cfgs:
-            return self.engine_cfgs.CleanEngine
+        engine_cfgs = self.engine_cfgs
+        if engine_cfgs:
+            return engine_cfgs.CleanEngine
         else:
             return False
 
     @property   # read-only
     def needs_fullframe_engine(self):
         """bool: Check if command needs a full-frame IronPython engine."""
-        if self.engine_cfgs:
-            return self.engine_cfgs.FullFrameEngine
+        engine_cfgs = self.engine_cfgs
+        if engine_cfgs:
+            return engine_cfgs.FullFrameEngine
         else:
             return False
 
     @property   # read-only
     def needs_persistent_engine(self):
         """bool: Check if command needs a persistent IronPython engine."""
-        if self.engine_cfgs:
-            return self.engine_cfgs.PersistentEngine
+        engine_cfgs = self.engine_cfgs
+        if engine_cfgs:
+            return engine_cfgs.PersistentEngine
         else:
             return False
 
@@ -596,90 +651,91 @@ class _ExecutorParams(object):
         """``PyRevitLabs.PyRevit.Runtime.ScriptConsole``:
                 Return output window. handle
         """
-        if self.script_runtime:
-            return self.script_runtime.OutputWindow
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.OutputWindow
 
     @property
     def command_data(self):
         """``ExternalCommandData``: Return current command data."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.CommandData
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.CommandData
 
     @property
     def command_elements(self):
         """``DB.ElementSet``: Return elements passed to by Revit."""
-        if self.script_runtime_cfgs:
-            return self.script_runtime_cfgs.SelectedElements
+        runtime_cfgs = self.script_runtime_cfgs
+        if runtime_cfgs:
+            return runtime_cfgs.SelectedElements
 
     @property   # read-only
     def command_path(self):
         """str: Return current command path."""
-        if '__commandpath__' in __builtins__ \
-                and __builtins__['__commandpath__']:
-            return __builtins__['__commandpath__']
+        builtin_value = _get_command_builtin('__commandpath__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return op.dirname(self.script_runtime.ScriptData.ScriptPath)
 
     @property   # read-only
     def command_config_path(self):
         """str: Return current command config script path."""
-        if '__configcommandpath__' in __builtins__ \
-                and __builtins__['__configcommandpath__']:
-            return __builtins__['__configcommandpath__']
+        builtin_value = _get_command_builtin('__configcommandpath__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return op.dirname(self.script_runtime.ScriptData.ConfigScriptPath)
 
     @property   # read-only
     def command_name(self):
         """str: Return current command name."""
-        if '__commandname__' in __builtins__ \
-                and __builtins__['__commandname__']:
-            return __builtins__['__commandname__']
+        builtin_value = _get_command_builtin('__commandname__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return self.script_runtime.ScriptData.CommandName
 
     @property   # read-only
     def command_bundle(self):
         """str: Return current command bundle name."""
-        if '__commandbundle__' in __builtins__ \
-                and __builtins__['__commandbundle__']:
-            return __builtins__['__commandbundle__']
+        builtin_value = _get_command_builtin('__commandbundle__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return self.script_runtime.ScriptData.CommandBundle
 
     @property   # read-only
     def command_extension(self):
         """str: Return current command extension name."""
-        if '__commandextension__' in __builtins__ \
-                and __builtins__['__commandextension__']:
-            return __builtins__['__commandextension__']
+        builtin_value = _get_command_builtin('__commandextension__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return self.script_runtime.ScriptData.CommandExtension
 
     @property   # read-only
     def command_uniqueid(self):
         """str: Return current command unique id."""
-        if '__commanduniqueid__' in __builtins__ \
-                and __builtins__['__commanduniqueid__']:
-            return __builtins__['__commanduniqueid__']
+        builtin_value = _get_command_builtin('__commanduniqueid__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return self.script_runtime.ScriptData.CommandUniqueId
 
     @property   # read-only
     def command_controlid(self):
         """str: Return current command control id."""
-        if '__commandcontrolid__' in __builtins__ \
-                and __builtins__['__commandcontrolid__']:
-            return __builtins__['__commandcontrolid__']
+        builtin_value = _get_command_builtin('__commandcontrolid__')
+        if builtin_value:
+            return builtin_value
         elif self.script_runtime:
             return self.script_runtime.ScriptData.CommandControlId
 
     @property   # read-only
     def command_uibutton(self):
         """str: Return current command ui button."""
-        if '__uibutton__' in __builtins__ \
-                and __builtins__['__uibutton__']:
-            return __builtins__['__uibutton__']
+        return _get_command_builtin('__uibutton__')
 
     @property
     def doc_mode(self):
@@ -692,8 +748,9 @@ class _ExecutorParams(object):
     @property
     def result_dict(self):
         """``Dictionary<String, String>``: Return results dict for logging."""
-        if self.script_runtime:
-            return self.script_runtime.GetResultsDictionary()
+        runtime = self.script_runtime
+        if runtime:
+            return runtime.GetResultsDictionary()
 
 
 # create an instance of _ExecutorParams wrapping current runtime.
@@ -737,15 +794,18 @@ else:
     for pyrvt_app_dir in [PYREVIT_APP_DIR,
                           PYREVIT_VERSION_APP_DIR,
                           THIRDPARTY_EXTENSIONS_DEFAULT_DIR]:
-        if not op.isdir(pyrvt_app_dir):
-            try:
-                os.mkdir(pyrvt_app_dir)
-                sys.path.append(pyrvt_app_dir)
-            except Exception as err:
+        # attempt to create the directory and let the failure mode
+        # decide; this is one filesystem call instead of a stat-then-
+        # create pair, and is race-free when several hosts start at
+        # the same time
+        try:
+            os.makedirs(pyrvt_app_dir)
+        except OSError as err:
+            if not op.isdir(pyrvt_app_dir):
                 raise PyRevitException('Can not access pyRevit '
                                        'folder at: {} | {}'
                                        .format(pyrvt_app_dir, err))
-        else:
+        if pyrvt_app_dir not in sys.path:
             sys.path.append(pyrvt_app_dir)
 
 
@@ -758,6 +818,11 @@ if EXEC_PARAMS.doc_mode:
     PYREVIT_FILE_PREFIX_UNIVERSAL_USER = PYREVIT_FILE_PREFIX_USER = \
         PYREVIT_FILE_PREFIX_STAMPED_USER = None
 else:
+    # grab host info once; these are properties hitting the host API
+    _host_ver = HOST_APP.version
+    _host_user = HOST_APP.username
+    _host_proc_id = HOST_APP.proc_id
+
     # e.g. pyRevit_
     PYREVIT_FILE_PREFIX_UNIVERSAL = '{}_'.format(PYREVIT_ADDON_NAME)
     PYREVIT_FILE_PREFIX_UNIVERSAL_REGEX = \
@@ -765,37 +830,37 @@ else:
 
     # e.g. pyRevit_2018_
     PYREVIT_FILE_PREFIX = '{}_{}_'.format(PYREVIT_ADDON_NAME,
-                                          HOST_APP.version)
+                                          _host_ver)
     PYREVIT_FILE_PREFIX_REGEX = \
         r'^' + PYREVIT_ADDON_NAME + r'_(?P<version>\d{4})_(?P<fname>.+)'
 
     # e.g. pyRevit_2018_14422_
     PYREVIT_FILE_PREFIX_STAMPED = '{}_{}_{}_'.format(PYREVIT_ADDON_NAME,
-                                                     HOST_APP.version,
-                                                     HOST_APP.proc_id)
+                                                     _host_ver,
+                                                     _host_proc_id)
     PYREVIT_FILE_PREFIX_STAMPED_REGEX = \
         r'^' + PYREVIT_ADDON_NAME \
         + r'_(?P<version>\d{4})_(?P<pid>\d+)_(?P<fname>.+)'
 
     # e.g. pyRevit_eirannejad_
     PYREVIT_FILE_PREFIX_UNIVERSAL_USER = '{}_{}_'.format(PYREVIT_ADDON_NAME,
-                                                         HOST_APP.username)
+                                                         _host_user)
     PYREVIT_FILE_PREFIX_UNIVERSAL_USER_REGEX = \
         r'^' + PYREVIT_ADDON_NAME + r'_(?P<user>.+)_(?P<fname>.+)'
 
     # e.g. pyRevit_2018_eirannejad_
     PYREVIT_FILE_PREFIX_USER = '{}_{}_{}_'.format(PYREVIT_ADDON_NAME,
-                                                  HOST_APP.version,
-                                                  HOST_APP.username)
+                                                  _host_ver,
+                                                  _host_user)
     PYREVIT_FILE_PREFIX_USER_REGEX = \
         r'^' + PYREVIT_ADDON_NAME \
         + r'_(?P<version>\d{4})_(?P<user>.+)_(?P<fname>.+)'
 
     # e.g. pyRevit_2018_eirannejad_14422_
     PYREVIT_FILE_PREFIX_STAMPED_USER = '{}_{}_{}_{}_'.format(PYREVIT_ADDON_NAME,
-                                                             HOST_APP.version,
-                                                             HOST_APP.username,
-                                                             HOST_APP.proc_id)
+                                                             _host_ver,
+                                                             _host_user,
+                                                             _host_proc_id)
     PYREVIT_FILE_PREFIX_STAMPED_USER_REGEX = \
         r'^' + PYREVIT_ADDON_NAME \
         + r'_(?P<version>\d{4})_(?P<user>.+)_(?P<pid>\d+)_(?P<fname>.+)'
@@ -33,3 +33,8 @@ safe_strtype = str
 if PY2:
     # https://gist.github.com/gornostal/1f123aaf838506038710
     safe_strtype = lambda x: unicode(x)  #pylint: disable=E0602,unnecessary-lambda
+
+if PY2:
+    intern_str = intern  #pylint: disable=E0602
+elif PY3:
+    intern_str = sys.intern
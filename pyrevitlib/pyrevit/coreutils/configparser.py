@@ -13,9 +13,13 @@ KEY_VALUE_FALSE = "False"
 
 class PyRevitConfigSectionParser(object):
     """Config section parser object. Handle section options."""
-    def __init__(self, config_parser, section_name):
+    def __init__(self, config_parser, section_name, value_cache=None):
         self._parser = config_parser
         self._section_name = section_name
+        # shared cache of decoded option values, keyed by
+        # (section, option); owned by the parent PyRevitConfigParser so
+        # all section parser instances see the same entries
+        self._value_cache = value_cache if value_cache is not None else {}
 
     def __iter__(self):
         return iter(self._parser.options(self._section_name))
@@ -30,47 +34,57 @@ class PyRevitConfigSectionParser(object):
                .format(id(self), self._section_name)
 
     def __getattr__(self, param_name):
+        cache_key = (self._section_name, param_name)
+        if cache_key in self._value_cache:
+            return self._value_cache[cache_key]
         try:
             value = self._parser.get(self._section_name, param_name)
+            parsed_value = self._parse_value(value)
+            self._value_cache[cache_key] = parsed_value
+            return parsed_value
+        except (configparser.NoOptionError, configparser.NoSectionError):
+            raise AttributeError('Parameter does not exist in config file: {}'
+                                 .format(param_name))
+
+    @staticmethod
+    def _parse_value(value):
+        try:
             try:
+                return json.loads(value)  #pylint: disable=W0123
+            except Exception:
+                # try fix legacy formats
+                # cleanup python style true, false values
+                if value == KEY_VALUE_TRUE:
+                    value = json.dumps(True)
+                elif value == KEY_VALUE_FALSE:
+                    value = json.dumps(False)
+                # cleanup string representations
+                value = value.replace('\'', '"').encode('string-escape')
+                # try parsing again
                 try:
                     return json.loads(value)  #pylint: disable=W0123
                 except Exception:
-                    # try fix legacy formats
-                    # cleanup python style true, false values
-                    if value == KEY_VALUE_TRUE:
-                        value = json.dumps(True)
-                    elif value == KEY_VALUE_FALSE:
-                        value = json.dumps(False)
-                    # cleanup string representations
-                    value = value.replace('\'', '"').encode('string-escape')
-                    # try parsing again
-                    try:
-                        return json.loads(value)  #pylint: disable=W0123
-                    except Exception:
-                        # if failed again then the value is a string
-                        # but is not encapsulated in quotes
-                        # e.g. option = C:\Users\Desktop
-                        value = value.strip()
-                        if not value.startswith('(') \
-                                or not value.startswith('[') \
-                                or not value.startswith('{'):
-                            value = "\"%s\"" % value
-                        return json.loads(value)  #pylint: disable=W0123
-            except Exception:
-                return value
-        except (configparser.NoOptionError, configparser.NoSectionError):
-            raise AttributeError('Parameter does not exist in config file: {}'
-                                 .format(param_name))
+                    # if failed again then the value is a string
+                    # but is not encapsulated in quotes
+                    # e.g. option = C:\Users\Desktop
+                    value = value.strip()
+                    if not value.startswith('(') \
+                            or not value.startswith('[') \
+                            or not value.startswith('{'):
+                        value = "\"%s\"" % value
+                    return json.loads(value)  #pylint: disable=W0123
+        except Exception:
+            return value
 
     def __setattr__(self, param_name, value):
         # check agaist used attribute names
-        if param_name in ['_parser', '_section_name']:
+        if param_name in ['_parser', '_section_name', '_value_cache']:
             super(PyRevitConfigSectionParser, self).__setattr__(param_name,
                                                                 value)
         else:
             # if not used by this object, then set a config section
             try:
+                self._value_cache.pop((self._section_name, param_name), None)
                 return self._parser.set(self._section_name,
                                         param_name,
                                         json.dumps(value,
@@ -110,6 +124,7 @@ class PyRevitConfigSectionParser(object):
 
     def remove_option(self, option_name):
         """Remove given option from section."""
+        self._value_cache.pop((self._section_name, option_name), None)
         return self._parser.remove_option(self._section_name, option_name)
 
     def has_subsection(self, section_name):
@@ -127,7 +142,9 @@ class PyRevitConfigSectionParser(object):
         subsections = []
         for section_name in self._parser.sections():
             if section_name.startswith(self._section_name + '.'):
-                subsec = PyRevitConfigSectionParser(self._parser, section_name)
+                subsec = PyRevitConfigSectionParser(self._parser,
+                                                    section_name,
+                                                    self._value_cache)
                 subsections.append(subsec)
         return subsections
 
@@ -143,6 +160,9 @@ class PyRevitConfigParser(object):
     def __init__(self, cfg_file_path=None):
         self._cfg_file_path = cfg_file_path
         self._parser = configparser.ConfigParser()
+        # decoded option values cache shared with all section parsers
+        # handed out by this object; cleared when config is re-read
+        self._value_cache = {}
         if self._cfg_file_path:
             try:
                 with codecs.open(self._cfg_file_path, 'r', 'utf-8') as cfg_file:
@@ -158,7 +178,9 @@ class PyRevitConfigParser(object):
     def __getattr__(self, section_name):
         if self._parser.has_section(section_name):
             # build a section parser object and return
-            return PyRevitConfigSectionParser(self._parser, section_name)
+            return PyRevitConfigSectionParser(self._parser,
+                                              section_name,
+                                              self._value_cache)
         else:
             raise AttributeError(
                 'Section \"{}\" does not exist in config file.'
@@ -182,7 +204,9 @@ class PyRevitConfigParser(object):
     def add_section(self, section_name):
         """Add section with given name to config."""
         self._parser.add_section(section_name)
-        return PyRevitConfigSectionParser(self._parser, section_name)
+        return PyRevitConfigSectionParser(self._parser,
+                                          section_name,
+                                          self._value_cache)
 
     def get_section(self, section_name):
         """Get section with given name.
@@ -192,7 +216,9 @@ class PyRevitConfigParser(object):
         """
         # check is section with full name is available
         if self._parser.has_section(section_name):
-            return PyRevitConfigSectionParser(self._parser, section_name)
+            return PyRevitConfigSectionParser(self._parser,
+                                              section_name,
+                                              self._value_cache)
 
         # if not try to match with section_name.subsection
         # if there is a section_name.subsection defined, that should be
@@ -202,7 +228,8 @@ class PyRevitConfigParser(object):
             master_section = coreutils.get_canonical_parts(cfg_section_name)[0]
             if section_name == master_section:
                 return PyRevitConfigSectionParser(self._parser,
-                                                  master_section)
+                                                  master_section,
+                                                  self._value_cache)
 
         # if no match happened then raise exception
         raise AttributeError('Section does not exist in config file.')
@@ -213,9 +240,11 @@ class PyRevitConfigParser(object):
         for cfg_subsection in cfg_section.get_subsections():
             self._parser.remove_section(cfg_subsection.header)
         self._parser.remove_section(cfg_section.header)
+        self._value_cache.clear()
 
     def reload(self, cfg_file_path=None):
         """Reload config from original or given file."""
+        self._value_cache.clear()
         try:
             with codecs.open(cfg_file_path \
                     or self._cfg_file_path, 'r', 'utf-8') as cfg_file:
@@ -79,9 +79,18 @@ RIBBONUPDATOR_ENVVAR = PRODUCT_NAME + "_RIBBONUPDATOR"
 TABCOLORIZER_ENVVAR = PRODUCT_NAME + "_TABCOLORIZER"
 
 
+# cached reference to the root env var dictionary; the dictionary is
+# only ever mutated in place once created so holding on to the
+# reference saves an AppDomain.GetData interop call per access
+_env_var_dict = None
+
+
 def get_pyrevit_env_vars():
     """Get the root dictionary, holding all environment variables."""
-    return AppDomain.CurrentDomain.GetData(ENV_VAR_DICT_NAME)
+    global _env_var_dict    #pylint: disable=W0603
+    if _env_var_dict is None:
+        _env_var_dict = AppDomain.CurrentDomain.GetData(ENV_VAR_DICT_NAME)
+    return _env_var_dict
 
 
 def get_pyrevit_env_var(param_name):
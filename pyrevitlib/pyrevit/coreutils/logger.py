@@ -1,11 +1,14 @@
 """Core logging module for pyRevit."""
 import sys
 import os.path as op
+import re
+import time
 import logging
+import logging.handlers
 
 #pylint: disable=W0703,C0302,C0103
 from pyrevit import EXEC_PARAMS, USER_DESKTOP
-from pyrevit.compat import safe_strtype
+from pyrevit.compat import PY3, safe_strtype
 from pyrevit import PYREVIT_VERSION_APP_DIR, PYREVIT_FILE_PREFIX_STAMPED
 from pyrevit import coreutils
 from pyrevit.coreutils import envvars
@@ -64,6 +67,18 @@ SUCCESS_LOG_LEVEL = 80
 logging.addLevelName(SUCCESS_LOG_LEVEL, "SUCCESS")
 
 
+# version counter for the logging env vars; bumped by every writer so
+# loggers can cache the resolved state and only re-read it when
+# something has actually changed
+_ENV_STATE_VERSION = [0]
+
+# python-side shadow of the logging env vars; the log dispatch path
+# reads these plain scalars, while writers keep the env vars in sync
+# for the non-python consumers of the environment store
+_LOG_LEVEL_SHADOW = [DEFAULT_LOGGING_LEVEL]
+_FILE_LOG_SHADOW = [False]
+
+
 # must be the same in this file and pyrevit/loader/runtime/envdict.cs
 # this is because the csharp code hasn't been compiled when the
 # logger module is imported in the other modules
@@ -72,6 +87,16 @@ if not EXEC_PARAMS.doc_mode:
                                 DEFAULT_LOGGING_LEVEL)
     envvars.set_pyrevit_env_var(envvars.FILELOGGING_ENVVAR,
                                 False)
+    _ENV_STATE_VERSION[0] += 1
+
+
+# matches characters that the html output window can not digest
+_NON_ASCII_REGEX = re.compile(u'[^\x00-\x7f]+')
+
+# backslash path separators double as escape characters in the html
+# output; on posix the separator is already the forward slash and the
+# replacement scan can be skipped entirely
+_NEED_SEP_REPLACE = op.sep != '/'
 
 
 # Creating default file log name and status
@@ -79,9 +104,98 @@ FILE_LOG_FILENAME = '{}runtime.log'.format(PYREVIT_FILE_PREFIX_STAMPED)
 FILE_LOG_FILEPATH = op.join(PYREVIT_VERSION_APP_DIR, FILE_LOG_FILENAME)
 FILE_LOGGING_DEFAULT_STATE = False
 
+# how many records the file-logging path collects before handing them
+# to the file handler in one batch
+FILE_LOG_BATCH_SIZE = 256
+
 
 # custom logger methods --------------------------------------------------------
 # (for module consistency and custom adjustments)
+class StaticFormatter(logging.Formatter):
+    """Formatter with the format-string inspection resolved once.
+
+    logging.Formatter re-scans its format string for %(asctime)s on
+    every record; the format never changes after construction so the
+    scan result is computed here once.
+    """
+    def __init__(self, fmt=None, datefmt=None):
+        logging.Formatter.__init__(self, fmt, datefmt)
+        self._uses_time = logging.Formatter.usesTime(self)
+        self._last_time_key = None
+        self._last_time_str = ''
+
+    def usesTime(self):
+        """Override logging.Formatter.usesTime"""
+        return self._uses_time
+
+    def formatTime(self, record, datefmt=None):
+        """Override logging.Formatter.formatTime"""
+        # the strftime output only changes once per second; reuse the
+        # last formatted second and rebuild the millisecond suffix only
+        time_key = (int(record.created), datefmt)
+        if time_key != self._last_time_key:
+            self._last_time_key = time_key
+            self._last_time_str = \
+                time.strftime(datefmt or '%Y-%m-%d %H:%M:%S',
+                              self.converter(record.created))
+        if datefmt:
+            return self._last_time_str
+        return '%s,%03d' % (self._last_time_str, record.msecs)
+
+
+class HtmlWrapFormatter(StaticFormatter):
+    """Formatter that wraps records in a constant html container.
+
+    The div container is identical for every record of a level, so it
+    is prebuilt as prefix and suffix strings once and only the inner
+    record format goes through the %-formatter per record.
+    """
+    def __init__(self, style_class, fmt, datefmt=None):
+        StaticFormatter.__init__(self, fmt, datefmt)
+        html_prefix, html_suffix = LOG_REC_FORMAT_HTML.split('{message}')
+        self._prefix = html_prefix.format(style=style_class)
+        self._suffix = html_suffix
+
+    def format(self, record):
+        """Override logging.Formatter.format"""
+        return \
+            self._prefix + StaticFormatter.format(self, record) + self._suffix
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves records in the stream buffer.
+
+    The base handler flushes its stream after every record, paying a
+    disk write per log line. This handler opens the log file with a
+    large write buffer and only forces the buffer out for records at
+    ERROR and above and on close; lower level records reach disk when
+    the buffer fills.
+    """
+
+    buffer_size = 64 * 1024
+
+    def _open(self):
+        # builtin open to control the buffer size; the base
+        # implementation only customizes the stream for encodings,
+        # which this module does not use
+        return open(self.baseFilename, self.mode, self.buffer_size)
+
+    def emit(self, record):
+        """Override logging.FileHandler.emit"""
+        self._flush_wanted = record.levelno >= logging.ERROR
+        logging.FileHandler.emit(self, record)
+
+    def flush(self):
+        """Override logging.StreamHandler.flush"""
+        if getattr(self, '_flush_wanted', True):
+            logging.FileHandler.flush(self)
+
+    def close(self):
+        """Override logging.FileHandler.close"""
+        self._flush_wanted = True
+        logging.FileHandler.close(self)
+
+
 class DispatchingFormatter(object):
     """Dispatching formatter to format by log level.
 
@@ -93,66 +207,144 @@ class DispatchingFormatter(object):
     def __init__(self, log_formatters, log_default_formatter):
         self._formatters = log_formatters
         self._default_formatter = log_default_formatter
+        # flat table indexed by level number; log levels are small
+        # ints so an indexed load is cheaper than a hashed dict lookup
+        # on the per-record path
+        self._formatter_table = \
+            [log_default_formatter] * (max(log_formatters) + 1)
+        for log_level, log_formatter in log_formatters.items():
+            self._formatter_table[log_level] = log_formatter
 
     def format(self, record):
         """Format given record by log level."""
-        formatter = self._formatters.get(record.levelno,
-                                         self._default_formatter)
-        return formatter.format(record)
+        try:
+            formatter = self._formatter_table[record.levelno]
+        except IndexError:
+            formatter = self._default_formatter
+        output = formatter.format(record)
+        # messages coerced from non-str objects may carry characters
+        # the html output window can not digest; scrub those records
+        # from the console output only, so the file log keeps the
+        # original message and plain str messages pass through
+        # untouched as they always have
+        if getattr(record, 'coerced_msg', False):
+            output = _NON_ASCII_REGEX.sub('', output)
+            if _NEED_SEP_REPLACE:
+                output = output.replace(op.sep, '/')
+        return output
 
 
 class LoggerWrapper(logging.Logger):
     """Custom logging object.
 
-    Args:
-        val (type): desc
-        val (type): desc
+    Pass format arguments lazily instead of pre-formatting messages:
+
+        >>> logger.debug('value is %s', value)      # formats only if emitted
+        >>> logger.debug('value is %s' % value)     # always formats; avoid
+
+    The level gate in :func:`isEnabledFor` runs before the log record
+    (and the formatted message) is ever built, so suppressed calls in
+    the lazy form cost a single level check.
     """
+
+    # slot descriptors for the state touched on every log call; the
+    # base Logger still carries a dict for its own attributes
+    __slots__ = ('_has_errors', '_filelogstate', '_curlevel', '_envlevel',
+                 '_cached_version', '_stream_hdlr', '_file_hdlr')
+
     def __init__(self, *args):
         logging.Logger.__init__(self, *args)
         self._has_errors = False
         self._filelogstate = False
         self._curlevel = DEFAULT_LOGGING_LEVEL
+        self._envlevel = DEFAULT_LOGGING_LEVEL
+        self._cached_version = -1
+        # prebound by get_logger so record dispatch does not need to
+        # scan and type-check the handler list per record
+        self._stream_hdlr = None
+        self._file_hdlr = None
+
+    def _update_env_state(self):
+        """Update cached logging state from pyRevit environment.
+
+        The env vars are only re-read when a writer has bumped the
+        state version; otherwise the cached values are reused so the
+        per-record check stays a plain integer compare.
+        """
+        if self._cached_version != _ENV_STATE_VERSION[0]:
+            self._cached_version = _ENV_STATE_VERSION[0]
+            self._filelogstate = _FILE_LOG_SHADOW[0]
+            self._envlevel = _LOG_LEVEL_SHADOW[0]
+
+        # the loader assembly sets EXEC_PARAMS.debug_mode to true if
+        # user Ctrl-clicks on the button at script runtime.
+        if EXEC_PARAMS.debug_mode:
+            self._curlevel = logging.DEBUG
+        else:
+            self._curlevel = self._envlevel
 
     def _log(self, level, msg, args, exc_info=None, extra=None): #pylint: disable=W0221
         self._has_errors = (self._has_errors or level >= logging.ERROR)
 
-        # any report other than logging.INFO level,
-        # needs to cleanup < and > character to avoid html conflict
+        # bail out before any message processing when neither the
+        # stream handler nor the file handler is going to emit
+        self._update_env_state()
+        if level < self._curlevel and not self._filelogstate:
+            return
+
+        # messages coerced from non-str objects get flagged on the
+        # record; the stdout formatter scrubs html-incompatible
+        # characters from flagged records only at emit time, and the
+        # record itself keeps the original message for the file log
         if not isinstance(msg, str):
             msg_str = safe_strtype(msg)
-            # get rid of unicode characters
-            msg_str = msg_str.encode('ascii', 'ignore')
-            msg_str = msg_str.replace(op.sep, '/')
+            extra = dict(extra) if extra else {}
+            extra['coerced_msg'] = True
         else:
             msg_str = msg
         logging.Logger._log(self, level, msg_str, args,
                             exc_info=exc_info, extra=extra)
 
+    def findCaller(self, *args, **kwargs):  #pylint: disable=W0221
+        """Override logging.Logger.findCaller"""
+        # none of the pyrevit log formats use the caller info
+        # (pathname, lineno, funcName); skip the sys._getframe walk
+        # the base implementation performs for every record.
+        # py3 passes stack_info/stacklevel and expects the stack info
+        # as a fourth element
+        if PY3:
+            return "(unknown file)", 0, "(unknown function)", None
+        return "(unknown file)", 0, "(unknown function)"
+
     def callHandlers(self, record):
         """Override logging.Logger.callHandlers"""
-        for hdlr in self.handlers:
+        stream_hdlr = self._stream_hdlr
+        file_hdlr = self._file_hdlr
+        if stream_hdlr or file_hdlr:
+            # fast path for loggers wired up by get_logger
             # stream-handler only records based on current level
-            if isinstance(hdlr, logging.StreamHandler) \
+            if stream_hdlr and record.levelno >= self._curlevel:
+                stream_hdlr.handle(record)
+            # file-handler must record everything; it sits behind the
+            # batching memory handler
+            if file_hdlr and self._filelogstate:
+                file_hdlr.handle(record)
+            return
+
+        # loggers configured outside get_logger keep the generic scan
+        for hdlr in self.handlers:
+            if isinstance(hdlr, (logging.FileHandler,
+                                 logging.handlers.MemoryHandler)):
+                if self._filelogstate:
+                    hdlr.handle(record)
+            elif isinstance(hdlr, logging.StreamHandler) \
                     and record.levelno >= self._curlevel:
                 hdlr.handle(record)
-            # file-handler must record everything
-            elif isinstance(hdlr, logging.FileHandler) \
-                    and self._filelogstate:
-                hdlr.handle(record)
 
     def isEnabledFor(self, level):
         """Override logging.Logger.isEnabledFor"""
         # update current logging level and file logging state
-        self._filelogstate = \
-            envvars.get_pyrevit_env_var(envvars.FILELOGGING_ENVVAR)
-        self._curlevel = \
-            envvars.get_pyrevit_env_var(envvars.LOGGING_LEVEL_ENVVAR)
-
-        # the loader assembly sets EXEC_PARAMS.debug_mode to true if
-        # user Ctrl-clicks on the button at script runtime.
-        if EXEC_PARAMS.debug_mode:
-            self._curlevel = logging.DEBUG
+        self._update_env_state()
 
         # if file logging is disabled, return the current logging level
         # but if it's enabled, return the file logging level so the record
@@ -165,19 +357,14 @@ class LoggerWrapper(logging.Logger):
 
     def is_enabled_for(self, level):
         """Check if logger is enabled for level in pyRevit environment."""
-        self._curlevel = \
-            envvars.get_pyrevit_env_var(envvars.LOGGING_LEVEL_ENVVAR)
-
-        # the loader assembly sets EXEC_PARAMS.debug_mode to true if
-        # user Ctrl-clicks on the button at script runtime.
-        if EXEC_PARAMS.debug_mode:
-            self._curlevel = logging.DEBUG
-
+        self._update_env_state()
         return level >= self._curlevel
 
     @staticmethod
     def _reset_logger_env_vars(log_level):
         envvars.set_pyrevit_env_var(envvars.LOGGING_LEVEL_ENVVAR, log_level)
+        _LOG_LEVEL_SHADOW[0] = log_level
+        _ENV_STATE_VERSION[0] += 1
 
     def has_errors(self):
         """Check if logger has reported any errors."""
@@ -205,7 +392,8 @@ class LoggerWrapper(logging.Logger):
 
     def get_level(self):
         """Return current logging level."""
-        return envvars.get_pyrevit_env_var(envvars.LOGGING_LEVEL_ENVVAR)
+        self._update_env_state()
+        return self._curlevel
 
     def log_parse_except(self, parsed_file, parse_ex):
         err_msg = '<strong>Error while parsing file:</strong>\n{file}\n' \
@@ -245,22 +433,44 @@ class LoggerWrapper(logging.Logger):
 
 
 # setting up handlers and formatters -------------------------------------------
-stdout_hndlr = logging.StreamHandler(sys.stdout)
-# e.g [_parser] DEBUG: Can not create command.
-default_formatter = logging.Formatter(LOG_REC_FORMAT)
-formatters = {
-    SUCCESS_LOG_LEVEL: logging.Formatter(LOG_REC_FORMAT_SUCCESS),
-    logging.ERROR: logging.Formatter(LOG_REC_FORMAT_ERROR),
-    logging.WARNING: logging.Formatter(LOG_REC_FORMAT_WARNING),
-    logging.CRITICAL: logging.Formatter(LOG_REC_FORMAT_CRITICAL),
-    DEPRECATE_LOG_LEVEL: logging.Formatter(LOG_REC_FORMAT_DEPRECATE)
-    }
-stdout_hndlr.setFormatter(DispatchingFormatter(formatters, default_formatter))
-
+if not EXEC_PARAMS.doc_mode:
+    stdout_hndlr = logging.StreamHandler(sys.stdout)
+    # e.g [_parser] DEBUG: Can not create command.
+    default_formatter = StaticFormatter(LOG_REC_FORMAT)
+    formatters = {
+        SUCCESS_LOG_LEVEL: HtmlWrapFormatter(LOG_REC_CLASS_SUCCESS,
+                                             LOG_REC_FORMAT_HEADER_NO_NAME),
+        logging.ERROR: HtmlWrapFormatter(LOG_REC_CLASS_ERROR,
+                                         LOG_REC_FORMAT_HEADER),
+        logging.WARNING: HtmlWrapFormatter(LOG_REC_CLASS_WARNING,
+                                           LOG_REC_FORMAT_HEADER),
+        logging.CRITICAL: HtmlWrapFormatter(LOG_REC_CLASS_CRITICAL,
+                                            LOG_REC_FORMAT_HEADER),
+        DEPRECATE_LOG_LEVEL: HtmlWrapFormatter(LOG_REC_CLASS_DEPRECATE,
+                                               LOG_REC_FORMAT_HEADER_NO_NAME)
+        }
+    stdout_hndlr.setFormatter(
+        DispatchingFormatter(formatters, default_formatter)
+        )
 
-file_hndlr = logging.FileHandler(FILE_LOG_FILEPATH, mode='a', delay=True)
-file_formatter = logging.Formatter(LOG_REC_FORMAT_FILE)
-file_hndlr.setFormatter(file_formatter)
+    # file writes stay synchronous on purpose: the queue-based async
+    # handlers (QueueHandler/QueueListener) do not exist on the 2.7
+    # engines, and a background writer thread would outlive the script
+    # scope the host gives each command
+    file_hndlr = BufferedFileHandler(FILE_LOG_FILEPATH, mode='a', delay=True)
+    file_formatter = StaticFormatter(LOG_REC_FORMAT_FILE)
+    file_hndlr.setFormatter(file_formatter)
+    # collect records in memory and pass them to the file handler in
+    # batches; records at ERROR and above (and logging.shutdown at exit)
+    # flush the batch immediately
+    file_mem_hndlr = logging.handlers.MemoryHandler(FILE_LOG_BATCH_SIZE,
+                                                    flushLevel=logging.ERROR,
+                                                    target=file_hndlr)
+else:
+    # doc generation only needs the module importable; skip handler and
+    # formatter setup and hand out no-op handlers instead
+    stdout_hndlr = logging.NullHandler()
+    file_hndlr = file_mem_hndlr = logging.NullHandler()
 
 
 def get_stdout_hndlr():
@@ -275,6 +485,12 @@ def get_stdout_hndlr():
     return stdout_hndlr
 
 
+# command-mode file handlers, memoized by command name; the command
+# label is baked into the format string so handlers can be shared
+# between loggers of the same command but not across commands
+cmd_file_hndlrs = {}
+
+
 def get_file_hndlr():
     """Return file logging handler object.
 
@@ -285,19 +501,30 @@ def get_file_hndlr():
     global file_hndlr       #pylint: disable=W0603
 
     if EXEC_PARAMS.command_mode:
-        cmd_file_hndlr = logging.FileHandler(FILE_LOG_FILEPATH,
-                                             mode='a', delay=True)
-        logformat = LOG_REC_FORMAT_FILE_C.format(EXEC_PARAMS.command_name)
-        formatter = logging.Formatter(logformat)
-        cmd_file_hndlr.setFormatter(formatter)
-        return cmd_file_hndlr
+        cmd_name = EXEC_PARAMS.command_name
+        cmd_hndlr = cmd_file_hndlrs.get(cmd_name)
+        if cmd_hndlr is None:
+            cmd_file_hndlr = BufferedFileHandler(FILE_LOG_FILEPATH,
+                                                 mode='a', delay=True)
+            logformat = LOG_REC_FORMAT_FILE_C.format(cmd_name)
+            formatter = StaticFormatter(logformat)
+            cmd_file_hndlr.setFormatter(formatter)
+            cmd_hndlr = logging.handlers.MemoryHandler(FILE_LOG_BATCH_SIZE,
+                                                       flushLevel=logging.ERROR,
+                                                       target=cmd_file_hndlr)
+            cmd_file_hndlrs[cmd_name] = cmd_hndlr
+        return cmd_hndlr
     else:
-        return file_hndlr
+        return file_mem_hndlr
 
 
 # setting up public logger. this will be imported in with other modules -------
 if not EXEC_PARAMS.doc_mode:
     logging.setLoggerClass(LoggerWrapper)
+    # emit errors run through logging's own error handler which checks
+    # this flag and prints a traceback to stderr; skip that machinery
+    # in normal runs but keep it while debugging pyRevit itself
+    logging.raiseExceptions = EXEC_PARAMS.debug_mode
 
 
 loggers = {}
@@ -320,16 +547,20 @@ def get_logger(logger_name):
         >>> get_logger('my command')
         ... <LoggerWrapper ...>
     """
-    if loggers.get(logger_name):
-        return loggers.get(logger_name)
-    else:
+    logger = loggers.get(logger_name)
+    if logger is None:
         logger = logging.getLogger(logger_name)    # type: LoggerWrapper
-        logger.addHandler(get_stdout_hndlr())
+        stream_hdlr = get_stdout_hndlr()
+        file_hdlr = get_file_hndlr()
+        logger.addHandler(stream_hdlr)
         logger.propagate = False
-        logger.addHandler(get_file_hndlr())
+        logger.addHandler(file_hdlr)
+        # bind handlers for the specialized record dispatch
+        logger._stream_hdlr = stream_hdlr
+        logger._file_hdlr = file_hdlr
 
-        loggers.update({logger_name: logger})
-        return logger
+        loggers[logger_name] = logger
+    return logger
 
 
 def set_file_logging(status):
@@ -339,6 +570,8 @@ def set_file_logging(status):
         status (bool): True to enable, False to disable
     """
     envvars.set_pyrevit_env_var(envvars.FILELOGGING_ENVVAR, status)
+    _FILE_LOG_SHADOW[0] = status
+    _ENV_STATE_VERSION[0] += 1
 
 
 def loggers_have_errors():
@@ -6,19 +6,27 @@ from pyrevit.framework import StringReader
 from pyrevit.labs import libyaml
 
 
+# sentinel for getattr probes below; None is a legitimate node value
+_MISSING = object()
+
+
 def _convert_yamldotnet_to_dict(ynode, level=0):
     # logger.debug('{}* Processing: {}'.format(' '*level, type(ynode)))
-    if hasattr(ynode, 'Children'):
+    children = getattr(ynode, 'Children', _MISSING)
+    if children is not _MISSING:
         d = OrderedDict()
         value_childs = []
-        for child in ynode.Children:
+        for child in children:
             # logger.debug('{}+ Child: {}'.format(' '*level, child))
-            if hasattr(child, 'Key') and hasattr(child, 'Value'):
-                d[child.Key.Value] = \
-                    _convert_yamldotnet_to_dict(child.Value, level=level+1)
-            elif hasattr(child, 'Value'):
-                val = child.Value
-                value_childs.append(val)
+            # probe the .NET node attributes once instead of a
+            # hasattr check followed by a second attribute access
+            key_node = getattr(child, 'Key', _MISSING)
+            value_node = getattr(child, 'Value', _MISSING)
+            if key_node is not _MISSING and value_node is not _MISSING:
+                d[key_node.Value] = \
+                    _convert_yamldotnet_to_dict(value_node, level=level+1)
+            elif value_node is not _MISSING:
+                value_childs.append(value_node)
         return value_childs or d
     else:
         # logger.debug('{}- Child: {}'.format(' '*level, ynode.Value))
@@ -34,11 +42,11 @@ def load(yaml_file):
     Returns:
         obj`YamlDotNet.RepresentationModel.YamlMappingNode`: yaml node
     """
-    with open(yaml_file, 'r') as yamlfile:
+    with codecs.open(yaml_file, 'r', 'utf-8') as yamlfile:
         yamlstr = libyaml.RepresentationModel.YamlStream()
         yamlstr.Load(
             StringReader(
-                yamlfile.read().decode('utf-8')
+                yamlfile.read()
                 ))
         if yamlstr.Documents.Count >= 1:
             return yamlstr.Documents[0].RootNode
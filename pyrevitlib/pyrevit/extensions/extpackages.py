@@ -37,7 +37,8 @@ class PyRevitPluginRemoveException(PyRevitException):
 PLUGIN_EXT_DEF_MANIFEST_NAME = 'extensions'
 PLUGIN_EXT_DEF_FILE = PLUGIN_EXT_DEF_MANIFEST_NAME + exts.JSON_FILE_FORMAT
 
-EXTENSION_POSTFIXES = [x.POSTFIX for x in exts.ExtensionTypes.get_ext_types()]
+EXTENSION_POSTFIXES = \
+    tuple(x.POSTFIX for x in exts.ExtensionTypes.get_ext_types())
 
 
 class DependencyGraph:
@@ -409,11 +410,17 @@ def _remove_extpkg(extpkg, remove_dependencies=True):
 def _find_internal_extpkgs(ext_dir):
     internal_extpkg_def_files = []
     mlogger.debug('Looking for internal package defs under %s', ext_dir)
-    for subfolder in os.listdir(ext_dir):
-        if any([subfolder.endswith(x) for x in EXTENSION_POSTFIXES]):
+    # os.scandir hands out pre-joined paths and skips the per-entry
+    # op.join; not available under ironpython 2.7 so fall back to listdir
+    if hasattr(os, 'scandir'):
+        subfolders = [(x.name, x.path) for x in os.scandir(ext_dir)]
+    else:
+        subfolders = [(x, op.join(ext_dir, x)) for x in os.listdir(ext_dir)]
+    for subfolder, subfolder_path in subfolders:
+        if subfolder.endswith(EXTENSION_POSTFIXES):
             mlogger.debug('Found extension folder %s', subfolder)
             int_extpkg_deffile = \
-                op.join(ext_dir, subfolder, exts.EXT_MANIFEST_FILE)
+                op.join(subfolder_path, exts.EXT_MANIFEST_FILE)
             mlogger.debug('Looking for %s', int_extpkg_deffile)
             if op.exists(int_extpkg_deffile):
                 mlogger.debug('Found %s', int_extpkg_deffile)
@@ -4,8 +4,10 @@ import os.path as op
 import re
 import codecs
 import copy
+from collections import deque
 
 from pyrevit import HOST_APP, PyRevitException
+from pyrevit.compat import intern_str
 from pyrevit import coreutils
 from pyrevit.coreutils import yaml
 from pyrevit.coreutils import applocales
@@ -17,6 +19,116 @@ import pyrevit.extensions as exts
 mlogger = coreutils.logger.get_logger(__name__)
 
 
+LAYOUT_DIRECTIVE_RE = re.compile(r'(.+)\[(.+):(.*)\]')
+
+# script global variables extracted as command metadata
+SCRIPT_META_PARAMS = (
+    exts.UI_TITLE_PARAM,
+    exts.DOCSTRING_PARAM,
+    exts.AUTHOR_PARAM,
+    exts.AUTHORS_PARAM,
+    exts.MAX_REVIT_VERSION_PARAM,
+    exts.MIN_REVIT_VERSION_PARAM,
+    exts.COMMAND_HELP_URL_PARAM,
+    exts.BETA_SCRIPT_PARAM,
+    exts.HIGHLIGHT_SCRIPT_PARAM,
+    exts.CLEAN_ENGINE_SCRIPT_PARAM,
+    exts.FULLFRAME_ENGINE_PARAM,
+    exts.PERSISTENT_ENGINE_PARAM,
+    exts.COMMAND_CONTEXT_PARAM,
+    )
+
+# key for the script docstring in extracted script metadata
+SCRIPT_DOCSTRING_KEY = 'docstring'
+
+# script file extension to script language id
+_SCRIPT_FILE_LANGUAGES = {
+    exts.PYTHON_SCRIPT_FILE_FORMAT: exts.PYTHON_LANG,
+    exts.CSHARP_SCRIPT_FILE_FORMAT: exts.CSHARP_LANG,
+    exts.VB_SCRIPT_FILE_FORMAT: exts.VB_LANG,
+    exts.RUBY_SCRIPT_FILE_FORMAT: exts.RUBY_LANG,
+    exts.DYNAMO_SCRIPT_FILE_FORMAT: exts.DYNAMO_LANG,
+    exts.GRASSHOPPER_SCRIPT_FILE_FORMAT: exts.GRASSHOPPER_LANG,
+    exts.GRASSHOPPERX_SCRIPT_FILE_FORMAT: exts.GRASSHOPPER_LANG,
+    }
+
+# process-local memos of parsed bundle metadata, keyed by file path and
+# checked against file mtime and size. the extension-level caches
+# (cacher_asc, cacher_bin) cover warm starts across sessions; these
+# cover repeated parses within one session e.g. on pyRevit reload
+_bundle_meta_memo = {}
+_script_meta_memo = {}
+
+# directory listings of module search paths, keyed by path; one
+# readdir per unique search path instead of a stat call per
+# (component, module, path) probe. entries are normcased so that
+# membership tests match the case-insensitive windows filesystem
+_searchpath_contents = {}
+
+
+def _get_searchpath_contents(search_path):
+    contents = _searchpath_contents.get(search_path)
+    if contents is None:
+        try:
+            contents = \
+                frozenset([op.normcase(x) for x in os.listdir(search_path)])
+        except OSError:
+            contents = frozenset()
+        _searchpath_contents[search_path] = contents
+    return contents
+
+
+# host version as integer, converted once; bundle version bounds are
+# checked against this inside UI filtering loops
+_host_version = []
+
+
+def _get_host_version():
+    if not _host_version:
+        _host_version.append(int(HOST_APP.version))
+    return _host_version[0]
+
+
+def _file_memo_key(file_path):
+    try:
+        file_stat = os.stat(file_path)
+        return (file_stat.st_mtime, file_stat.st_size)
+    except OSError:
+        return None
+
+
+def _load_bundle_metadata(meta_file):
+    """Load bundle yaml metadata, memoized on file mtime and size."""
+    memo_key = _file_memo_key(meta_file)
+    if memo_key is None:
+        return yaml.load_as_dict(meta_file)
+    cached_key, cached_meta = _bundle_meta_memo.get(meta_file, (None, None))
+    if cached_key != memo_key:
+        cached_meta = yaml.load_as_dict(meta_file)
+        _bundle_meta_memo[meta_file] = (memo_key, cached_meta)
+    # hand out a copy since callers may modify their meta dict
+    return copy.deepcopy(cached_meta)
+
+
+def _extract_script_metadata(script_file):
+    """Extract script global params, memoized on file mtime and size."""
+    memo_key = _file_memo_key(script_file)
+    if memo_key is not None:
+        cached_key, cached_params = \
+            _script_meta_memo.get(script_file, (None, None))
+        if cached_key == memo_key:
+            return copy.deepcopy(cached_params)
+    script_content = coreutils.ScriptFileParser(script_file)
+    extracted_params = {
+        param: script_content.extract_param(param)
+        for param in SCRIPT_META_PARAMS
+        }
+    extracted_params[SCRIPT_DOCSTRING_KEY] = script_content.get_docstring()
+    if memo_key is not None:
+        _script_meta_memo[script_file] = (memo_key, extracted_params)
+    return copy.deepcopy(extracted_params)
+
+
 EXT_DIR_KEY = 'directory'
 SUB_CMP_KEY = 'components'
 LAYOUT_ITEM_KEY = 'layout_items'
@@ -30,8 +142,14 @@ class TypedComponent(object):
 
 
 class CachableComponent(TypedComponent):
+    # attribute names holding runtime-only state that must not be
+    # serialized into the extension cache
+    cache_skip_keys = ()
+
     def get_cache_data(self):
         cache_dict = self.__dict__.copy()
+        for transient_key in self.cache_skip_keys:
+            cache_dict.pop(transient_key, None)
         if hasattr(self, TYPE_ID_KEY):
             cache_dict[TYPE_ID_KEY] = getattr(self, TYPE_ID_KEY)
         return cache_dict
@@ -66,10 +184,14 @@ class GenericComponent(CachableComponent):
 
 
 class GenericUIComponent(GenericComponent):
+    cache_skip_keys = ('_dir_items', '_dir_lookup')
+
     def __init__(self, cmp_path=None):
         # using classname otherwise exceptions in superclasses won't show
         GenericComponent.__init__(self)
         self.directory = cmp_path
+        self._dir_items = None
+        self._dir_lookup = None
         self.unique_name = self.parent_ctrl_id = None
         self.icon_file = None
         self._ui_title = None
@@ -108,16 +230,17 @@ class GenericUIComponent(GenericComponent):
             unique name would be: 'pyrevit-pyrevit-edit-flipdoors'
         """
         pieces = []
-        inside_ext = False
-        for dname in cmp_path.split(op.sep):
-            if exts.ExtensionTypes.UI_EXTENSION.POSTFIX in dname:
-                inside_ext = True
-
-            name, ext = op.splitext(dname)
-            if ext != '' and inside_ext:
-                pieces.append(name)
-            else:
-                continue
+        # segments before the extension folder never contribute to the
+        # name; locate the extension marker once and only split the
+        # path tail starting at the segment that carries it
+        marker_index = \
+            cmp_path.find(exts.ExtensionTypes.UI_EXTENSION.POSTFIX)
+        if marker_index >= 0:
+            tail_start = cmp_path.rfind(op.sep, 0, marker_index) + 1
+            for dname in cmp_path[tail_start:].split(op.sep):
+                name, ext = op.splitext(dname)
+                if ext != '':
+                    pieces.append(name)
         return coreutils.cleanup_string(
             exts.UNIQUE_ID_SEPARATOR.join(pieces),
             skip=[exts.UNIQUE_ID_SEPARATOR]
@@ -127,13 +250,33 @@ class GenericUIComponent(GenericComponent):
         return '<type_id \'{}\' name \'{}\' @ \'{}\'>'\
             .format(self.type_id, self.name, self.directory)
 
+    def _list_directory(self):
+        # snapshot the bundle directory contents once; all later file
+        # and folder probes test against this list instead of issuing
+        # a stat call per probe
+        if self._dir_items is None:
+            try:
+                self._dir_items = os.listdir(self.directory)
+            except OSError:
+                self._dir_items = []
+        return self._dir_items
+
+    def _in_directory(self, item_name):
+        # filesystem probes are case-insensitive on windows; normcase
+        # both sides so snapshot membership matches op.exists behavior
+        if self._dir_lookup is None:
+            self._dir_lookup = \
+                set([op.normcase(x) for x in self._list_directory()])
+        return op.normcase(item_name) in self._dir_lookup
+
     def _update_from_directory(self):
         self.name = op.splitext(op.basename(self.directory))[0]
         self._ui_title = self.name
         self.unique_name = GenericUIComponent.make_unique_name(self.directory)
 
-        full_file_path = op.join(self.directory, exts.DEFAULT_ICON_FILE)
-        self.icon_file = full_file_path if op.exists(full_file_path) else None
+        self.icon_file = \
+            op.join(self.directory, exts.DEFAULT_ICON_FILE) \
+            if self._in_directory(exts.DEFAULT_ICON_FILE) else None
         mlogger.debug('Icon file is: %s:%s', self.name, self.icon_file)
 
         self.media_file = \
@@ -145,8 +288,9 @@ class GenericUIComponent(GenericComponent):
 
         # each component can store custom libraries under
         # lib/ inside the component folder
-        lib_path = op.join(self.directory, exts.COMP_LIBRARY_DIR_NAME)
-        self.library_path = lib_path if op.exists(lib_path) else None
+        self.library_path = \
+            op.join(self.directory, exts.COMP_LIBRARY_DIR_NAME) \
+            if self._in_directory(exts.COMP_LIBRARY_DIR_NAME) else None
 
         # setting up search paths. These paths will be added to
         # all sub-components of this component.
@@ -155,8 +299,9 @@ class GenericUIComponent(GenericComponent):
 
         # each component can store custom binaries under
         # bin/ inside the component folder
-        bin_path = op.join(self.directory, exts.COMP_BIN_DIR_NAME)
-        self.binary_path = bin_path if op.exists(bin_path) else None
+        self.binary_path = \
+            op.join(self.directory, exts.COMP_BIN_DIR_NAME) \
+            if self._in_directory(exts.COMP_BIN_DIR_NAME) else None
 
         # setting up search paths. These paths will be added to
         # all sub-components of this component.
@@ -170,7 +315,7 @@ class GenericUIComponent(GenericComponent):
         if self.meta_file:
             # sets up self.meta
             try:
-                self.meta = yaml.load_as_dict(self.meta_file)
+                self.meta = _load_bundle_metadata(self.meta_file)
                 if self.meta:
                     self._read_bundle_metadata()
             except Exception as err:
@@ -184,13 +329,6 @@ class GenericUIComponent(GenericComponent):
         elif isinstance(source, dict):
             return applocales.get_locale_string(source)
 
-    def _resolve_liquid_tag(self, param_name, key, value):
-        liquid_tag = '{{' + key + '}}'
-        exst_val = getattr(self, param_name)
-        if exst_val and (liquid_tag in exst_val):   #pylint: disable=E1135
-            new_value = exst_val.replace(liquid_tag, value)
-            setattr(self, param_name, new_value)
-
     def _read_bundle_metadata(self):
         self._ui_title = self.meta.get(exts.MDATA_UI_TITLE, self._ui_title)
 
@@ -247,12 +385,12 @@ class GenericUIComponent(GenericComponent):
     def is_supported(self):
         if self.min_revit_ver:
             # If host is older than the minimum host version, raise exception
-            if int(HOST_APP.version) < int(self.min_revit_ver):
+            if _get_host_version() < int(self.min_revit_ver):
                 mlogger.debug('Requires min version: %s', self.min_revit_ver)
                 return False
         if self.max_revit_ver:
             # If host is newer than the max host version, raise exception
-            if int(HOST_APP.version) > int(self.max_revit_ver):
+            if _get_host_version() > int(self.max_revit_ver):
                 mlogger.debug('Requires max version: %s', self.max_revit_ver)
                 return False
         return True
@@ -280,16 +418,19 @@ class GenericUIComponent(GenericComponent):
 
     def find_bundle_file(self, patterns, finder='postfix'):
         if self.directory:
-            for bundle_file in os.listdir(self.directory):
-                if 'name' == finder:
-                    for file_name in patterns:
-                        if op.splitext(bundle_file)[0] == file_name:
-                            return op.join(self.directory, bundle_file)
-                elif 'postfix' == finder:
-                    for file_postfix in patterns:
-                        if bundle_file.endswith(file_postfix):
-                            return op.join(self.directory, bundle_file)
-                elif 'regex' == finder:
+            if 'postfix' == finder:
+                # endswith accepts a tuple and checks all postfixes
+                # in a single call
+                postfixes = tuple(patterns)
+                for bundle_file in self._list_directory():
+                    if bundle_file.endswith(postfixes):
+                        return op.join(self.directory, bundle_file)
+            elif 'name' == finder:
+                for bundle_file in self._list_directory():
+                    if op.splitext(bundle_file)[0] in patterns:
+                        return op.join(self.directory, bundle_file)
+            elif 'regex' == finder:
+                for bundle_file in self._list_directory():
                     for regex_pattern in patterns:
                         if re.match(regex_pattern, bundle_file):
                             return op.join(self.directory, bundle_file)
@@ -300,33 +441,63 @@ class GenericUIComponent(GenericComponent):
         if op.isfile(module):
             return module
 
-        # test if module is inside search paths
+        # modules carrying a relative path can not be resolved against
+        # the search path listing index; probe those directly
+        if op.sep in module or '/' in module:
+            for module_path in self.module_paths:
+                possible_module_path = op.join(module_path, module)
+                if op.isfile(possible_module_path):
+                    return possible_module_path
+            return None
+
+        # test if module is inside search paths; misses cost a set
+        # lookup only, hits get verified as files with a single stat
+        module_key = op.normcase(module)
         for module_path in self.module_paths:
-            possible_module_path = op.join(module_path, module)
-            if op.isfile(possible_module_path):
-                return possible_module_path
+            if module_key in _get_searchpath_contents(module_path):
+                possible_module_path = op.join(module_path, module)
+                if op.isfile(possible_module_path):
+                    return possible_module_path
+
+    configurable_params = ('_ui_title', '_tooltip', '_help_url', 'author')
 
     def configure(self, config_dict):
-        configurable_params = \
-            ['_ui_title', '_tooltip', '_help_url', 'author']
-        # get root key:value pairs
-        for key, value in config_dict.items():
-            for param_name in configurable_params:
-                self._resolve_liquid_tag(param_name, key, value)
-        # get key:value pairs grouped under special key, if exists
-        templates = config_dict.get(exts.MDATA_TEMPLATES_KEY, {})
-        for key, value in templates.items():
-            for param_name in configurable_params:
-                self._resolve_liquid_tag(param_name, key, value)
+        # flatten root key:value pairs and the pairs grouped under the
+        # special templates key into one lookup; root values win
+        liquid_values = dict(config_dict.get(exts.MDATA_TEMPLATES_KEY, {}))
+        liquid_values.update(config_dict)
+        if not liquid_values:
+            return
+        # one compiled pattern matching any {{key}}; each configurable
+        # param is scanned once regardless of key count
+        liquid_finder = re.compile(
+            r'\{\{(' +
+            '|'.join(re.escape(key) for key in liquid_values) +
+            r')\}\}')
+        for param_name in self.configurable_params:
+            param_value = getattr(self, param_name)
+            if param_value and '{{' in param_value:  #pylint: disable=E1135
+                new_value = liquid_finder.sub(
+                    lambda match: liquid_values[match.group(1)],
+                    param_value)
+                if new_value != param_value:
+                    setattr(self, param_name, new_value)
 
 
 # superclass for all UI group items (tab, panel, button groups, stacks)
 class GenericUIContainer(GenericUIComponent):
     allowed_sub_cmps = []
 
+    cache_skip_keys = \
+        GenericUIComponent.cache_skip_keys \
+        + ('_cmps_of_type', '_cmp_names', '_laidout_cmps')
+
     def __init__(self, cmp_path=None):
         self.layout_items = []
         self.components = []
+        self._cmps_of_type = {}
+        self._cmp_names = set()
+        self._laidout_cmps = None
         # using classname otherwise exceptions in superclasses won't show
         GenericUIComponent.__init__(self, cmp_path=cmp_path)
 
@@ -345,14 +516,25 @@ class GenericUIContainer(GenericUIComponent):
             component._ui_title = directive.target
 
     def __iter__(self):
+        # the ui build iterates containers several times; reorder per
+        # layout once and reuse until add_component drops the memo
+        if self._laidout_cmps is None:
+            self._laidout_cmps = self._get_components_per_layout()
+        return self._laidout_cmps
+
+    def _get_components_per_layout(self):
         # if item is not listed in layout, it will not be created
         if self.layout_items:
             mlogger.debug('Reordering components per layout file...')
             laidout_cmps = []
+            # index components by name once instead of scanning the
+            # component list per layout item; first component wins on
+            # duplicate names, matching the scan this replaces
+            cmps_by_name = {}
+            for component in self.components:
+                cmps_by_name.setdefault(component.name, component)
             for litem in self.layout_items:
-                matching_cmp = \
-                        next((x for x in self.components
-                              if x.name == litem.name), None)
+                matching_cmp = cmps_by_name.get(litem.name)
                 if matching_cmp:
                     # apply directives before adding to list
                     if litem.directive:
@@ -381,17 +563,30 @@ class GenericUIContainer(GenericUIComponent):
             return self.components
 
     def parse_layout_directive(self, layout_line):
-        parts = re.findall(r'(.+)\[(.+):(.*)\]', layout_line)
+        # most layout lines carry no directive; skip the regex entirely
+        if '[' not in layout_line:
+            return layout_line, None
+        parts = LAYOUT_DIRECTIVE_RE.findall(layout_line)
         if parts:
             source_item, directive, target_value = parts[0]
-            # cleanup values
+            # cleanup values; the directive type comes from a tiny
+            # vocabulary repeated across many layout items so intern
+            # it and let equality checks hit the identity fast path
             directive = directive.lower().strip()
+            try:
+                directive = intern_str(str(directive))
+            except UnicodeEncodeError:
+                # non-ascii directive types can not be interned on 2.7
+                pass
             target_value = target_value.strip()
             # process any escape characters in target value
             # https://stackoverflow.com/a/4020824/2350244
             # decode('string_escape') for python 2
-            target_value = \
-                target_value.encode('utf-8').decode('string_escape')
+            # most targets carry no escapes; skip the codec round-trip
+            # unless a backslash is present
+            if '\\' in target_value:
+                target_value = \
+                    target_value.encode('utf-8').decode('string_escape')
             # create directive obj
             return source_item, LayoutDirective(directive_type=directive,
                                                 target=target_value)
@@ -418,8 +613,10 @@ class GenericUIContainer(GenericUIComponent):
             return True
 
     def parse_layout_file(self):
-        layout_filepath = op.join(self.directory, exts.DEFAULT_LAYOUT_FILE_NAME)
-        if op.exists(layout_filepath):
+        # probe against the directory snapshot; no stat call needed
+        if self._in_directory(exts.DEFAULT_LAYOUT_FILE_NAME):
+            layout_filepath = \
+                op.join(self.directory, exts.DEFAULT_LAYOUT_FILE_NAME)
             mlogger.deprecate(
                 "\"_layout\" file is deprecated. "
                 "use bundle.yaml instead. | %s", self)
@@ -431,7 +628,7 @@ class GenericUIContainer(GenericUIComponent):
                           self)
 
     def contains(self, item_name):
-        return any([x.name == item_name for x in self.components])
+        return item_name in self._cmp_names
 
     def add_module_path(self, path):
         if path and not self.has_module_path(path):
@@ -456,23 +653,44 @@ class GenericUIContainer(GenericUIComponent):
             comp.parent_ctrl_id = self.control_id
         # now add to list
         self.components.append(comp)
+        self._cmp_names.add(comp.name)
+        self._cmps_of_type.clear()
+        self._laidout_cmps = None
 
     def find_components_of_type(self, cmp_type):
-        sub_comp_list = []
-        for sub_comp in self.components:
-            if isinstance(sub_comp, cmp_type):
-                sub_comp_list.append(sub_comp)
-            elif sub_comp.is_container:
-                sub_comp_list.extend(sub_comp.find_components_of_type(cmp_type))
-
-        return sub_comp_list
+        # the assembly build queries the same containers repeatedly;
+        # memoize per queried type. mutation goes through add_component
+        # which drops the memo; the tree is fully assembled before the
+        # first query during load
+        sub_comp_list = self._cmps_of_type.get(cmp_type)
+        if sub_comp_list is None:
+            # walk with an explicit stack instead of recursing; same
+            # depth-first order, and matching containers are still not
+            # searched for nested matches
+            sub_comp_list = []
+            cmp_stack = deque(reversed(self.components))
+            while cmp_stack:
+                sub_comp = cmp_stack.pop()
+                if isinstance(sub_comp, cmp_type):
+                    sub_comp_list.append(sub_comp)
+                elif sub_comp.is_container:
+                    cmp_stack.extend(reversed(sub_comp.components))
+            self._cmps_of_type[cmp_type] = sub_comp_list
+
+        # hand out a copy so callers can not modify the memoized list
+        return list(sub_comp_list)
 
     def find_layout_items(self):
+        # walk the container tree with an explicit stack; avoids one
+        # python frame per nested container while keeping the same
+        # depth-first order as the recursive version
         layout_items = []
-        layout_items.extend(self.layout_items)
-        for sub_comp in self.components:
-            if sub_comp.is_container:
-                layout_items.extend(sub_comp.find_layout_items())
+        container_stack = deque([self])
+        while container_stack:
+            container = container_stack.pop()
+            layout_items.extend(container.layout_items)
+            container_stack.extend(
+                x for x in reversed(container.components) if x.is_container)
         return layout_items
 
     def configure(self, config_dict):
@@ -506,6 +724,7 @@ class GenericUICommand(GenericUIComponent):
     def __init__(self, cmp_path=None, needs_script=True):
         self.needs_script = needs_script
         self.script_file = self.config_script_file = None
+        self._is_cpython = None
         self.arguments = []
         self.context = None
         self.class_name = self.avail_class_name = None
@@ -637,62 +856,53 @@ class GenericUICommand(GenericUIComponent):
     def _read_bundle_metadata_from_python_script(self):
         try:
             # reading script file content to extract parameters
-            script_content = \
-                coreutils.ScriptFileParser(self.script_file)
+            script_params = _extract_script_metadata(self.script_file)
 
             self._ui_title = \
-                script_content.extract_param(exts.UI_TITLE_PARAM) \
-                    or self._ui_title
+                script_params[exts.UI_TITLE_PARAM] or self._ui_title
 
-            script_docstring = script_content.get_docstring()
-            custom_docstring = \
-                script_content.extract_param(exts.DOCSTRING_PARAM)
+            script_docstring = script_params[SCRIPT_DOCSTRING_KEY]
+            custom_docstring = script_params[exts.DOCSTRING_PARAM]
             self._tooltip = \
                 custom_docstring or script_docstring or self._tooltip
 
-            script_author = script_content.extract_param(exts.AUTHOR_PARAM)
-            script_author = script_content.extract_param(exts.AUTHORS_PARAM)
+            script_author = script_params[exts.AUTHORS_PARAM]
             if isinstance(script_author, list):
                 script_author = '\n'.join(script_author)
             self.author = script_author or self.author
 
             # extracting min requried Revit and pyRevit versions
             self.max_revit_ver = \
-                script_content.extract_param(exts.MAX_REVIT_VERSION_PARAM) \
+                script_params[exts.MAX_REVIT_VERSION_PARAM] \
                     or self.max_revit_ver
             self.min_revit_ver = \
-                script_content.extract_param(exts.MIN_REVIT_VERSION_PARAM) \
+                script_params[exts.MIN_REVIT_VERSION_PARAM] \
                     or self.min_revit_ver
             self._help_url = \
-                script_content.extract_param(exts.COMMAND_HELP_URL_PARAM) \
+                script_params[exts.COMMAND_HELP_URL_PARAM] \
                     or self._help_url
 
             self.is_beta = \
-                script_content.extract_param(exts.BETA_SCRIPT_PARAM) \
-                    or self.is_beta
+                script_params[exts.BETA_SCRIPT_PARAM] or self.is_beta
 
             self.highlight_type = \
-                script_content.extract_param(exts.HIGHLIGHT_SCRIPT_PARAM) \
+                script_params[exts.HIGHLIGHT_SCRIPT_PARAM] \
                     or self.highlight_type
 
             # only True when command is specifically asking for
             # a clean engine or a fullframe engine. False if not set.
             self.requires_clean_engine = \
-                script_content.extract_param(exts.CLEAN_ENGINE_SCRIPT_PARAM) \
-                    or False
+                script_params[exts.CLEAN_ENGINE_SCRIPT_PARAM] or False
             self.requires_fullframe_engine = \
-                script_content.extract_param(exts.FULLFRAME_ENGINE_PARAM) \
-                    or False
+                script_params[exts.FULLFRAME_ENGINE_PARAM] or False
             self.requires_persistent_engine = \
-                script_content.extract_param(exts.PERSISTENT_ENGINE_PARAM) \
-                    or False
+                script_params[exts.PERSISTENT_ENGINE_PARAM] or False
 
             # panel buttons should be active always
             if self.type_id == exts.PANEL_PUSH_BUTTON_POSTFIX:
                 self.context = exts.CTX_ZERODOC[0]
             else:
-                self.context = \
-                    script_content.extract_param(exts.COMMAND_CONTEXT_PARAM)
+                self.context = script_params[exts.COMMAND_CONTEXT_PARAM]
                 if isinstance(self.context, list):
                     self.context = coreutils.join_strings(self.context)
 
@@ -707,22 +917,8 @@ class GenericUICommand(GenericUIComponent):
     @property
     def script_language(self):
         if self.script_file is not None:
-            if self.script_file.endswith(exts.PYTHON_SCRIPT_FILE_FORMAT):
-                return exts.PYTHON_LANG
-            elif self.script_file.endswith(exts.CSHARP_SCRIPT_FILE_FORMAT):
-                return exts.CSHARP_LANG
-            elif self.script_file.endswith(exts.VB_SCRIPT_FILE_FORMAT):
-                return exts.VB_LANG
-            elif self.script_file.endswith(exts.RUBY_SCRIPT_FILE_FORMAT):
-                return exts.RUBY_LANG
-            elif self.script_file.endswith(exts.DYNAMO_SCRIPT_FILE_FORMAT):
-                return exts.DYNAMO_LANG
-            elif self.script_file.endswith(
-                    exts.GRASSHOPPER_SCRIPT_FILE_FORMAT) \
-                    or self.script_file.endswith(
-                        exts.GRASSHOPPERX_SCRIPT_FILE_FORMAT
-                    ):
-                return exts.GRASSHOPPER_LANG
+            return _SCRIPT_FILE_LANGUAGES.get(
+                op.splitext(self.script_file)[1])
         else:
             return None
 
@@ -735,8 +931,13 @@ class GenericUICommand(GenericUIComponent):
 
     @property
     def is_cpython(self):
-        with open(self.script_file, 'r') as script_f:
-            return exts.CPYTHON_HASHBANG in script_f.readline()
+        # checked during parse and again at execution time; read the
+        # script hashbang once and keep the answer
+        if self._is_cpython is None:
+            with open(self.script_file, 'r') as script_f:
+                self._is_cpython = \
+                    exts.CPYTHON_HASHBANG in script_f.readline()
+        return self._is_cpython
 
     def has_config_script(self):
         return self.config_script_file != self.script_file
@@ -8,6 +8,7 @@ import sys
 import os
 import os.path as op
 import string
+import codecs
 from collections import OrderedDict, namedtuple
 import threading
 from functools import wraps
@@ -59,6 +60,24 @@ WPF_COLLAPSED = framework.Windows.Visibility.Collapsed
 WPF_VISIBLE = framework.Windows.Visibility.Visible
 
 
+# cache of xaml source strings keyed by file path; entries hold the
+# file stat so edited files are re-read on next window open
+XAML_SOURCE_CACHE = {}
+
+
+def _read_xaml_source(xaml_file):
+    """Read xaml file content, cached across window re-opens."""
+    xaml_stat = os.stat(xaml_file)
+    stat_key = (xaml_stat.st_mtime, xaml_stat.st_size)
+    cached_source = XAML_SOURCE_CACHE.get(xaml_file, None)
+    if cached_source and cached_source[0] == stat_key:
+        return cached_source[1]
+    with codecs.open(xaml_file, 'r', 'utf-8-sig') as xaml_srcfile:
+        xaml_source = xaml_srcfile.read()
+    XAML_SOURCE_CACHE[xaml_file] = (stat_key, xaml_source)
+    return xaml_source
+
+
 XAML_FILES_DIR = op.dirname(__file__)
 
 
@@ -160,11 +179,16 @@ class WPFWindow(framework.Windows.Window):
 
         if not literal_string:
             if not op.exists(xaml_source):
-                wpf.LoadComponent(self,
-                                  os.path.join(EXEC_PARAMS.command_path,
-                                               xaml_source))
+                xaml_file = os.path.join(EXEC_PARAMS.command_path,
+                                         xaml_source)
             else:
-                wpf.LoadComponent(self, xaml_source)
+                xaml_file = xaml_source
+            # load from the cached source string; skips re-reading and
+            # encoding-detecting the file on window re-opens
+            wpf.LoadComponent(
+                self,
+                framework.StringReader(_read_xaml_source(xaml_file))
+                )
         else:
             wpf.LoadComponent(self, framework.StringReader(xaml_source))
 
@@ -4,15 +4,25 @@ from pyrevit import framework
 from pyrevit.framework import wpf, Controls, Imaging
 
 
+# decoded bitmaps keyed by file path; bitmaps are frozen so they are
+# safe to share between windows and threads
+BITMAP_CACHE = {}
+
+
 def bitmap_from_file(bitmap_file):
     """Create BitmapImage from a bitmap file.
 
+    Bitmaps are decoded once per file path and cached for reuse.
+
     Args:
         bitmap_file (str): path to bitmap file
 
     Returns:
         BitmapImage: bitmap image object
     """
+    bitmap = BITMAP_CACHE.get(bitmap_file, None)
+    if bitmap:
+        return bitmap
     bitmap = Imaging.BitmapImage()
     bitmap.BeginInit()
     bitmap.UriSource = framework.Uri(bitmap_file)
@@ -20,6 +30,7 @@ def bitmap_from_file(bitmap_file):
     bitmap.CreateOptions = Imaging.BitmapCreateOptions.IgnoreImageCache
     bitmap.EndInit()
     bitmap.Freeze()
+    BITMAP_CACHE[bitmap_file] = bitmap
     return bitmap
 
 
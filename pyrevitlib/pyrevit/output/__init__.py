@@ -38,6 +38,8 @@ mlogger = logger.get_logger(__name__)
 
 
 DEFAULT_STYLESHEET_NAME = 'outputstyles.css'
+DEFAULT_STYLESHEET_FILEPATH = op.join(op.dirname(__file__),
+                                      DEFAULT_STYLESHEET_NAME)
 
 
 def docclosing_eventhandler(sender, args):  #pylint: disable=W0613
@@ -72,7 +74,7 @@ def get_stylesheet():
 
 def get_default_stylesheet():
     """Return default css stylesheet used by output window."""
-    return op.join(op.dirname(__file__), DEFAULT_STYLESHEET_NAME)
+    return DEFAULT_STYLESHEET_FILEPATH
 
 
 def reset_stylesheet():